@@ -34,6 +34,10 @@ class BaseAnalyzer(ABC):
     def _safe_analyze(self, content: str, file_path: str, tree: ast.AST = None) -> List[RefactoringGuidance]:
         """
         Safely run analysis with error handling
+        
+        The tree is shared with the other analyzers and cached across calls
+        on the same source, so analyzers must treat it as read-only and
+        never modify its nodes.
         """
         try:
             return self.analyze(content, file_path, tree)
@@ -5,6 +5,7 @@ Complexipy-based cognitive complexity analyzer
 
 import ast
 import os
+import re
 import subprocess
 import tempfile
 from typing import List
@@ -12,6 +13,9 @@ from typing import List
 from ..models import RefactoringGuidance
 from .base import BaseAnalyzer
 
+# Strips everything but digits from a complexipy output line in one C-level pass
+_NON_DIGITS_RE = re.compile(r'\D+')
+
 
 class ComplexipyAnalyzer(BaseAnalyzer):
     """Analyzer using Complexipy for cognitive complexity analysis"""
@@ -37,12 +41,15 @@ class ComplexipyAnalyzer(BaseAnalyzer):
                     # Parse complexipy output for cognitive complexity issues
                     lines = result.stdout.split('\n')
                     for line in lines:
-                        if 'cognitive complexity' in line.lower() and any(char.isdigit() for char in line):
+                        if 'cognitive complexity' not in line.lower():
+                            continue
+                        digits = _NON_DIGITS_RE.sub('', line)
+                        if digits:
                             # Extract function name and complexity value
                             parts = line.split()
                             if len(parts) >= 3:
                                 try:
-                                    complexity = int(''.join(filter(str.isdigit, line)))
+                                    complexity = int(digits)
                                     if complexity > 15:  # High cognitive complexity threshold
                                         function_name = parts[0] if parts[0] != 'Function' else parts[1]
                                         guidance_list.append(
@@ -13,6 +13,28 @@ from typing import List
 from ..models import RefactoringGuidance
 from .base import BaseAnalyzer
 
+# pip-audit severity labels mapped to guidance severities
+_SEVERITY_MAP = {
+    'CRITICAL': 'critical',
+    'HIGH': 'high',
+    'MODERATE': 'medium',
+    'MEDIUM': 'medium',
+    'LOW': 'low'
+}
+
+# Description keywords checked in order when no explicit severity is given
+_SEVERITY_INDICATORS = (
+    # High severity indicators
+    ('critical', (
+        'remote code execution', 'rce', 'critical', 'arbitrary code',
+        'privilege escalation', 'authentication bypass'
+    )),
+    # Medium-high severity indicators
+    ('high', ('sql injection', 'xss', 'csrf', 'path traversal', 'high severity')),
+    # Medium severity indicators
+    ('medium', ('denial of service', 'information disclosure', 'medium severity')),
+)
+
 
 class DependencySecurityAnalyzer(BaseAnalyzer):
     """Analyzer using pip-audit for dependency vulnerability scanning"""
@@ -264,36 +286,14 @@ class DependencySecurityAnalyzer(BaseAnalyzer):
         
         # Check for explicit severity in the vulnerability data
         if 'severity' in vulnerability:
-            severity_map = {
-                'CRITICAL': 'critical',
-                'HIGH': 'high',
-                'MODERATE': 'medium',
-                'MEDIUM': 'medium',
-                'LOW': 'low'
-            }
-            return severity_map.get(vulnerability['severity'].upper(), 'medium')
+            return _SEVERITY_MAP.get(vulnerability['severity'].upper(), 'medium')
         
         # Check for CVE scores or other indicators
         description = vulnerability.get('description', '').lower()
         
-        # High severity indicators
-        if any(indicator in description for indicator in [
-            'remote code execution', 'rce', 'critical', 'arbitrary code',
-            'privilege escalation', 'authentication bypass'
-        ]):
-            return 'critical'
-        
-        # Medium-high severity indicators
-        if any(indicator in description for indicator in [
-            'sql injection', 'xss', 'csrf', 'path traversal', 'high severity'
-        ]):
-            return 'high'
-        
-        # Medium severity indicators
-        if any(indicator in description for indicator in [
-            'denial of service', 'information disclosure', 'medium severity'
-        ]):
-            return 'medium'
+        for severity, indicators in _SEVERITY_INDICATORS:
+            if any(indicator in description for indicator in indicators):
+                return severity
         
         # Default to medium for unknown severities
         return 'medium'
@@ -12,6 +12,35 @@ from typing import List
 from ..models import RefactoringGuidance
 from .base import BaseAnalyzer
 
+# Refurb rules, by priority, used to grade modernization suggestions
+# High priority modernizations
+_HIGH_PRIORITY_RULES = (
+    'FURB105',  # Use print() instead of sys.stdout.write()
+    'FURB107',  # Use pathlib instead of os.path
+    'FURB109',  # Use dict.get() with default
+    'FURB110',  # Use any() instead of for loop
+    'FURB111',  # Use all() instead of for loop
+    'FURB113',  # Use itertools.compress() instead of manual filtering
+    'FURB118',  # Use dict comprehension instead of for loop
+)
+
+# Medium priority modernizations
+_MEDIUM_PRIORITY_RULES = (
+    'FURB101',  # Use pathlib
+    'FURB102',  # Use enumerate
+    'FURB103',  # Use write() mode for file operations
+    'FURB104',  # Use ternary operator
+    'FURB106',  # Use f-strings
+    'FURB108',  # Use dict methods
+    'FURB112',  # Use next() builtin
+    'FURB114',  # Use repeated f-strings
+    'FURB115',  # Use open() with context manager
+    'FURB116',  # Use isinstance() for type checking
+    'FURB117',  # Use dict comprehension
+    'FURB119',  # Use zip() for parallel iteration
+    'FURB120',  # Use enumerate() for indexed iteration
+)
+
 
 class ModernPatternsAnalyzer(BaseAnalyzer):
     """Analyzer using Refurb for modern Python pattern suggestions"""
@@ -162,37 +191,9 @@ class ModernPatternsAnalyzer(BaseAnalyzer):
     def _determine_severity(self, rule_id: str, message: str) -> str:
         """Determine severity based on refurb rule type"""
         
-        # High priority modernizations
-        high_priority_patterns = [
-            'FURB105',  # Use print() instead of sys.stdout.write()
-            'FURB107',  # Use pathlib instead of os.path
-            'FURB109',  # Use dict.get() with default
-            'FURB110',  # Use any() instead of for loop
-            'FURB111',  # Use all() instead of for loop
-            'FURB113',  # Use itertools.compress() instead of manual filtering
-            'FURB118',  # Use dict comprehension instead of for loop
-        ]
-        
-        # Medium priority modernizations
-        medium_priority_patterns = [
-            'FURB101',  # Use pathlib
-            'FURB102',  # Use enumerate
-            'FURB103',  # Use write() mode for file operations
-            'FURB104',  # Use ternary operator
-            'FURB106',  # Use f-strings
-            'FURB108',  # Use dict methods
-            'FURB112',  # Use next() builtin
-            'FURB114',  # Use repeated f-strings
-            'FURB115',  # Use open() with context manager
-            'FURB116',  # Use isinstance() for type checking
-            'FURB117',  # Use dict comprehension
-            'FURB119',  # Use zip() for parallel iteration
-            'FURB120',  # Use enumerate() for indexed iteration
-        ]
-        
-        if any(pattern in rule_id for pattern in high_priority_patterns):
+        if any(pattern in rule_id for pattern in _HIGH_PRIORITY_RULES):
             return "high"
-        elif any(pattern in rule_id for pattern in medium_priority_patterns):
+        elif any(pattern in rule_id for pattern in _MEDIUM_PRIORITY_RULES):
             return "medium"
         else:
             return "low"
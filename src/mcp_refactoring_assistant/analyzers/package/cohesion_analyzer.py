@@ -6,9 +6,10 @@ Cohesion analyzer for package-level analysis
 import ast
 from collections import defaultdict, Counter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Optional
 
 from ...models.package_models import CohesionMetrics
+from .source_cache import SourceCache, read_source_file
 
 
 class CohesionAnalyzer:
@@ -17,13 +18,15 @@ class CohesionAnalyzer:
     def __init__(self):
         self.name = "CohesionAnalyzer"
     
-    def analyze_package_cohesion(self, package_path: str, package_name: str) -> CohesionMetrics:
+    def analyze_package_cohesion(self, package_path: str, package_name: str,
+                                 source_cache: Optional[SourceCache] = None) -> CohesionMetrics:
         """
         Analyze cohesion metrics for a package
         
         Args:
             package_path: Path to the package directory
             package_name: Name of the package
+            source_cache: Optional cache shared with the other package analyzers
             
         Returns:
             CohesionMetrics containing cohesion analysis results
@@ -44,8 +47,7 @@ class CohesionAnalyzer:
         
         for file_path in python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = read_source_file(file_path, source_cache)
                 
                 file_analysis = self._analyze_file_cohesion(content, str(file_path))
                 all_classes.extend(file_analysis["classes"])
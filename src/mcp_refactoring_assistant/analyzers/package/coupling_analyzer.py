@@ -4,11 +4,12 @@ Coupling analyzer for package-level analysis
 """
 
 import ast
-from collections import defaultdict
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Optional
 
 from ...models.package_models import CouplingMetrics, DependencyGraph
+from .source_cache import SourceCache, read_source_file
 
 
 class CouplingAnalyzer:
@@ -18,7 +19,8 @@ class CouplingAnalyzer:
         self.name = "CouplingAnalyzer"
     
     def analyze_package_coupling(self, package_path: str, package_name: str, 
-                               dependency_graph: DependencyGraph) -> CouplingMetrics:
+                               dependency_graph: DependencyGraph,
+                               source_cache: Optional[SourceCache] = None) -> CouplingMetrics:
         """
         Analyze coupling metrics for a package
         
@@ -26,6 +28,7 @@ class CouplingAnalyzer:
             package_path: Path to the package directory
             package_name: Name of the package
             dependency_graph: Pre-computed dependency graph
+            source_cache: Optional cache shared with the other package analyzers
             
         Returns:
             CouplingMetrics containing coupling analysis results
@@ -38,7 +41,7 @@ class CouplingAnalyzer:
         
         # Calculate derived metrics
         instability = self._calculate_instability(afferent_coupling, efferent_coupling)
-        abstractness = self._calculate_abstractness(package_path)
+        abstractness = self._calculate_abstractness(package_path, source_cache)
         distance_from_main = self._calculate_distance_from_main_sequence(instability, abstractness)
         
         # Find tightly coupled modules
@@ -96,7 +99,8 @@ class CouplingAnalyzer:
         total_coupling = afferent + efferent
         return efferent / total_coupling if total_coupling > 0 else 0.0
     
-    def _calculate_abstractness(self, package_path: Path) -> float:
+    def _calculate_abstractness(self, package_path: Path,
+                                source_cache: Optional[SourceCache] = None) -> float:
         """
         Calculate abstractness metric (A) = abstract classes / total classes
         Range: 0 (concrete) to 1 (abstract)
@@ -110,8 +114,7 @@ class CouplingAnalyzer:
         
         for file_path in python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = read_source_file(file_path, source_cache)
                 
                 tree = ast.parse(content)
                 
@@ -195,10 +198,9 @@ class CouplingAnalyzer:
                 })
         
         # Find modules with high fan-in (many others depend on them)
-        fan_in_count = defaultdict(int)
+        fan_in_count = Counter()
         for module_deps in module_dependencies.values():
-            for target in module_deps:
-                fan_in_count[target] += 1
+            fan_in_count.update(module_deps.keys())
         
         for module, fan_in in fan_in_count.items():
             if fan_in > 5:  # Threshold for high coupling
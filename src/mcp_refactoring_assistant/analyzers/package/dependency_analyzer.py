@@ -10,6 +10,7 @@ from typing import Dict, List, Set, Tuple, Optional
 import importlib.util
 
 from ...models.package_models import ModuleDependency, DependencyGraph
+from .source_cache import SourceCache, read_source_file
 
 
 class DependencyAnalyzer:
@@ -18,12 +19,14 @@ class DependencyAnalyzer:
     def __init__(self):
         self.name = "DependencyAnalyzer"
     
-    def analyze_package_dependencies(self, package_path: str) -> DependencyGraph:
+    def analyze_package_dependencies(self, package_path: str,
+                                     source_cache: Optional[SourceCache] = None) -> DependencyGraph:
         """
         Analyze all dependencies within a package
         
         Args:
             package_path: Path to the package directory
+            source_cache: Optional cache shared with the other package analyzers
             
         Returns:
             DependencyGraph containing all dependency information
@@ -44,8 +47,7 @@ class DependencyAnalyzer:
             module_names.add(module_name)
             
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = read_source_file(file_path, source_cache)
                 
                 file_dependencies = self._extract_dependencies(content, module_name, str(file_path))
                 all_dependencies.extend(file_dependencies)
@@ -4,15 +4,23 @@ Package structure analyzer for detecting organizational issues
 """
 
 import ast
+import re
 from collections import defaultdict, Counter
 from pathlib import Path
-from typing import Dict, List, Set, Tuple, Any
+from typing import Dict, List, Set, Tuple, Any, Optional
 
 from ...models.package_models import (
     PackageStructureIssue, 
     PackageReorganizationSuggestion,
     DependencyGraph
 )
+from .source_cache import SourceCache, read_source_file
+
+# Splits CamelCase class names into words, e.g. "UserManager" -> ["User", "Manager"]
+_CAMEL_WORD_RE = re.compile(r'[A-Z][a-z]*')
+
+# Nodes that add one decision point to cyclomatic complexity
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler)
 
 
 class PackageStructureAnalyzer:
@@ -21,13 +29,15 @@ class PackageStructureAnalyzer:
     def __init__(self):
         self.name = "PackageStructureAnalyzer"
     
-    def analyze_package_structure(self, package_path: str, dependency_graph: DependencyGraph) -> Tuple[List[PackageStructureIssue], List[PackageReorganizationSuggestion]]:
+    def analyze_package_structure(self, package_path: str, dependency_graph: DependencyGraph,
+                                  source_cache: Optional[SourceCache] = None) -> Tuple[List[PackageStructureIssue], List[PackageReorganizationSuggestion]]:
         """
         Analyze package structure for organizational issues
         
         Args:
             package_path: Path to the package directory
             dependency_graph: Pre-computed dependency graph
+            source_cache: Optional cache shared with the other package analyzers
             
         Returns:
             Tuple of (structural issues, reorganization suggestions)
@@ -38,7 +48,7 @@ class PackageStructureAnalyzer:
         suggestions = []
         
         # Analyze package structure
-        structure_info = self._analyze_directory_structure(package_path)
+        structure_info = self._analyze_directory_structure(package_path, source_cache)
         
         # Detect various structural issues
         issues.extend(self._detect_scattered_functionality(structure_info, dependency_graph))
@@ -52,7 +62,8 @@ class PackageStructureAnalyzer:
         
         return issues, suggestions
     
-    def _analyze_directory_structure(self, package_path: Path) -> Dict[str, Any]:
+    def _analyze_directory_structure(self, package_path: Path,
+                                     source_cache: Optional[SourceCache] = None) -> Dict[str, Any]:
         """Analyze the directory structure and file organization"""
         structure_info = {
             "total_files": 0,
@@ -77,8 +88,7 @@ class PackageStructureAnalyzer:
                 
                 # Analyze file content
                 try:
-                    with open(item, 'r', encoding='utf-8') as f:
-                        content = f.read()
+                    content = read_source_file(item, source_cache)
                     
                     module_analysis = self._analyze_module_content(content, str(item))
                     module_analysis["file_path"] = str(item)
@@ -152,7 +162,7 @@ class PackageStructureAnalyzer:
         complexity = 1  # Base complexity
         
         for node in ast.walk(func_node):
-            if isinstance(node, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
+            if isinstance(node, _BRANCH_NODES):
                 complexity += 1
             elif isinstance(node, ast.BoolOp):
                 complexity += len(node.values) - 1
@@ -195,8 +205,7 @@ class PackageStructureAnalyzer:
                     suffix = cls["name"].split("_")[-1]
                 else:
                     # CamelCase - extract suffix
-                    import re
-                    words = re.findall(r'[A-Z][a-z]*', cls["name"])
+                    words = _CAMEL_WORD_RE.findall(cls["name"])
                     suffix = words[-1] if words else cls["name"]
                 
                 class_groups[suffix].append({
@@ -272,16 +281,21 @@ class PackageStructureAnalyzer:
         """Detect modules that are too tightly coupled (inappropriate intimacy)"""
         issues = []
         
-        # Count bidirectional dependencies
-        bidirectional_deps = defaultdict(int)
-        
-        for edge1 in dependency_graph.edges:
-            for edge2 in dependency_graph.edges:
-                if (edge1.source_module == edge2.target_module and 
-                    edge1.target_module == edge2.source_module and
-                    edge1.import_type == "local" and edge2.import_type == "local"):
-                    modules = tuple(sorted([edge1.source_module, edge1.target_module]))
-                    bidirectional_deps[modules] += 1
+        # Count bidirectional dependencies: every local edge a -> b pairs with
+        # every local edge b -> a, so tally edges per direction once and
+        # multiply instead of comparing every pair of edges
+        local_edges = Counter(
+            (edge.source_module, edge.target_module)
+            for edge in dependency_graph.edges
+            if edge.import_type == "local"
+        )
+        bidirectional_deps = Counter()
+        
+        for (source, target), count in local_edges.items():
+            reverse_count = local_edges.get((target, source))
+            if reverse_count:
+                modules = tuple(sorted([source, target]))
+                bidirectional_deps[modules] += count * reverse_count
         
         # Report inappropriate intimacy
         for (module1, module2), count in bidirectional_deps.items():
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Shared source file cache for package-level analysis
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple, Union
+
+# Source contents keyed on (absolute path, mtime_ns, size)
+SourceCache = Dict[Tuple[str, int, int], str]
+
+
+def read_source_file(file_path: Union[str, Path], cache: Optional[SourceCache] = None) -> str:
+    """
+    Read a Python source file, reusing the contents across package analyzers
+
+    Every package analyzer walks the same files, so a single package analysis
+    would otherwise read each file once per analyzer. The caller owns the
+    cache, typically one dict per package analysis, so nothing outlives it.
+    Entries are keyed on the absolute path, modification time and size, so
+    changed files are re-read.
+
+    Args:
+        file_path: Path to the source file
+        cache: Optional dict shared by the reads of one analysis
+
+    Returns:
+        The file contents decoded as UTF-8
+    """
+    if cache is None:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    abs_path = os.path.abspath(file_path)
+    stat = os.stat(abs_path)
+    key = (abs_path, stat.st_mtime_ns, stat.st_size)
+    content = cache.get(key)
+    if content is None:
+        with open(abs_path, 'r', encoding='utf-8') as f:
+            content = cache[key] = f.read()
+    return content
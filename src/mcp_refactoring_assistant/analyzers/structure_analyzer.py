@@ -52,10 +52,11 @@ class StructureAnalyzer(BaseAnalyzer):
                 
                 # Suggest splitting by classes if there are many
                 if len(classes) > 3:
-                    splitting_suggestions.extend([
-                        f"Extract class '{cls['name']}' (lines {cls['line_start']}-{cls['line_end']}) to separate module",
-                        f"Consider creating '{cls['name'].lower()}.py'"
-                    ] for cls in classes[:3])
+                    for cls in classes[:3]:
+                        splitting_suggestions.extend([
+                            f"Extract class '{cls['name']}' (lines {cls['line_start']}-{cls['line_end']}) to separate module",
+                            f"Consider creating '{cls['name'].lower()}.py'"
+                        ])
                 
                 # Suggest splitting by related functions
                 if len(functions) > 10:
@@ -5,20 +5,13 @@ Supports both MCP server mode and standalone operation
 """
 
 import click
-import json
 import os
-import sys
-from pathlib import Path
 from typing import Optional, List, Dict, Any
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-from rich.tree import Tree
-from rich.layout import Layout
-from rich.live import Live
 from rich import box
 import time
 
@@ -26,9 +19,28 @@ import time
 from .core import EnhancedRefactoringAnalyzer
 from .core.package_analyzer import PackageAnalyzer
 from .models import RefactoringGuidance
+from .serialization import dumps_json
 
 console = Console()
 
+# Severity lookups indexed by ordinal; the trailing entry is the fallback
+# used for unknown severities
+SEVERITY_LEVELS = ("critical", "high", "medium", "low")
+_SEVERITY_ORDINAL = {severity: i for i, severity in enumerate(SEVERITY_LEVELS)}
+_UNKNOWN_SEVERITY = len(SEVERITY_LEVELS)
+_SEVERITY_ICONS = ("🔴", "🟠", "🟡", "🔵", "⚪")
+_SEVERITY_COLORS = ("red", "orange3", "yellow", "blue", "white")
+
+_BANNER = """
+╔═══════════════════════════════════════════════════════════════╗
+║              🐍 Python Refactoring Assistant 🔧              ║
+║                                                               ║
+║  Comprehensive code analysis • Repository indexing           ║
+║  Coverage analysis • Quality insights • MCP Server           ║
+╚═══════════════════════════════════════════════════════════════╝
+        """
+
+
 class RefactoringCLI:
     """Enhanced CLI for Python refactoring analysis"""
     
@@ -41,15 +53,7 @@ class RefactoringCLI:
         
     def display_banner(self):
         """Display application banner"""
-        banner = """
-╔═══════════════════════════════════════════════════════════════╗
-║              🐍 Python Refactoring Assistant 🔧              ║
-║                                                               ║
-║  Comprehensive code analysis • Repository indexing           ║
-║  Coverage analysis • Quality insights • MCP Server           ║
-╚═══════════════════════════════════════════════════════════════╝
-        """
-        self.console.print(banner, style="bold cyan")
+        self.console.print(_BANNER, style="bold cyan")
         
     def analyze_file_interactive(self, file_path: str) -> Dict[str, Any]:
         """Interactive file analysis with progress display"""
@@ -71,12 +75,9 @@ class RefactoringCLI:
                     content = f.read()
                 
                 progress.update(task, description="🧠 Running complexity analysis...")
-                time.sleep(0.5)  # Visual feedback
-                
                 guidance_list = self.analyzer.analyze_file(file_path, content)
                 
                 progress.update(task, description="✅ Analysis complete!")
-                time.sleep(0.3)
                 
             except Exception as e:
                 self.console.print(f"❌ Analysis failed: {str(e)}", style="bold red")
@@ -87,15 +88,14 @@ class RefactoringCLI:
     def _format_analysis_results(self, guidance_list: List[RefactoringGuidance], file_path: str) -> Dict[str, Any]:
         """Format analysis results for display"""
         
+        counts = [0] * (_UNKNOWN_SEVERITY + 1)
+        for g in guidance_list:
+            counts[_SEVERITY_ORDINAL.get(g.severity, _UNKNOWN_SEVERITY)] += 1
+
         results = {
             "file_path": file_path,
             "total_issues": len(guidance_list),
-            "issues_by_severity": {
-                "critical": len([g for g in guidance_list if g.severity == "critical"]),
-                "high": len([g for g in guidance_list if g.severity == "high"]),
-                "medium": len([g for g in guidance_list if g.severity == "medium"]),
-                "low": len([g for g in guidance_list if g.severity == "low"])
-            },
+            "issues_by_severity": dict(zip(SEVERITY_LEVELS, counts)),
             "guidance": guidance_list
         }
         
@@ -130,12 +130,7 @@ class RefactoringCLI:
             table.add_column("Priority", justify="center")
             
             for guidance in results['guidance']:
-                severity_color = {
-                    'critical': 'red',
-                    'high': 'orange3',
-                    'medium': 'yellow',
-                    'low': 'blue'
-                }.get(guidance.severity, 'white')
+                severity_color = _SEVERITY_COLORS[_SEVERITY_ORDINAL.get(guidance.severity, _UNKNOWN_SEVERITY)]
                 
                 table.add_row(
                     f"[{severity_color}]{guidance.severity.upper()}[/{severity_color}]",
@@ -171,12 +166,14 @@ class RefactoringCLI:
         
         # Step-by-step instructions
         if guidance.precise_steps:
-            self.console.print("\n📋 [bold]Step-by-Step Instructions:[/bold]")
-            for i, step in enumerate(guidance.precise_steps, 1):
-                self.console.print(f"  {i}. {step}")
+            steps = "\n".join(f"  {i}. {step}" for i, step in enumerate(guidance.precise_steps, 1))
+            self.console.print(f"\n📋 [bold]Step-by-Step Instructions:[/bold]\n{steps}")
         
         # Code examples if available
         if hasattr(guidance, 'code_example') and guidance.code_example:
+            # rich.syntax pulls in pygments, so only import it when there is code to show
+            from rich.syntax import Syntax
+            
             self.console.print("\n💾 [bold]Code Example:[/bold]")
             syntax = Syntax(guidance.code_example, "python", theme="monokai")
             self.console.print(syntax)
@@ -189,29 +186,20 @@ class RefactoringCLI:
             return
             
         guidance_list = self.current_results['guidance']
-        
+
+        # Rows and choices never change while browsing, so build them once
+        # instead of on every pass through the menu. The whole menu is printed
+        # in one call so the console renders it in a single write.
+        rows = [self._format_guidance_row(i, guidance) for i, guidance in enumerate(guidance_list)]
+        menu = "\n".join(["\n" + "="*60, "🧭 [bold]Interactive Guidance Browser[/bold]", "="*60, *rows])
+        choices = [str(i+1) for i in range(len(guidance_list))] + ["q"]
+
         while True:
-            self.console.print("\n" + "="*60)
-            self.console.print("🧭 [bold]Interactive Guidance Browser[/bold]")
-            self.console.print("="*60)
-            
-            # List all issues
-            for i, guidance in enumerate(guidance_list):
-                severity_icon = {
-                    'critical': '🔴',
-                    'high': '🟠', 
-                    'medium': '🟡',
-                    'low': '🔵'
-                }.get(guidance.severity, '⚪')
-                
-                self.console.print(
-                    f"{i+1}. {severity_icon} {guidance.issue_type.replace('_', ' ').title()} "
-                    f"(Line {guidance.line_number if guidance.line_number else 'N/A'})"
-                )
-            
+            self.console.print(menu)
+
             choice = Prompt.ask(
                 "\nSelect issue to view details",
-                choices=[str(i+1) for i in range(len(guidance_list))] + ["q"],
+                choices=choices,
                 default="q"
             )
             
@@ -229,7 +217,16 @@ class RefactoringCLI:
                     
             except (ValueError, IndexError):
                 self.console.print("❌ Invalid selection", style="red")
-    
+
+    def _format_guidance_row(self, index: int, guidance: RefactoringGuidance) -> str:
+        """Format a single guidance entry for the interactive browser list"""
+        severity_icon = _SEVERITY_ICONS[_SEVERITY_ORDINAL.get(guidance.severity, _UNKNOWN_SEVERITY)]
+
+        return (
+            f"{index+1}. {severity_icon} {guidance.issue_type.replace('_', ' ').title()} "
+            f"(Line {guidance.line_number if guidance.line_number else 'N/A'})"
+        )
+
     def analyze_package_interactive(self, package_path: str, package_name: Optional[str] = None) -> Dict[str, Any]:
         """Interactive package analysis with progress display"""
         
@@ -250,23 +247,15 @@ class RefactoringCLI:
             task = progress.add_task("🔍 Analyzing package structure...", total=None)
             
             try:
-                progress.update(task, description="🧠 Analyzing dependencies...")
-                time.sleep(0.5)
+                # Dependencies, metrics, coupling and cohesion are all computed
+                # by analyze_package; the spinner runs for exactly that long
+                progress.update(task, description="🧠 Analyzing dependencies, coupling and cohesion...")
+                guidance = self.package_analyzer.analyze_package(package_path, package_name)
                 
                 progress.update(task, description="📊 Calculating metrics...")
-                time.sleep(0.5)
-                
-                progress.update(task, description="🔗 Analyzing coupling...")
-                time.sleep(0.5)
-                
-                progress.update(task, description="🎯 Analyzing cohesion...")
-                time.sleep(0.5)
-                
-                guidance = self.package_analyzer.analyze_package(package_path, package_name)
                 summary = self.package_analyzer.get_package_summary(guidance)
                 
                 progress.update(task, description="✅ Package analysis complete!")
-                time.sleep(0.3)
                 
             except Exception as e:
                 self.console.print(f"❌ Package analysis failed: {str(e)}", style="bold red")
@@ -371,27 +360,29 @@ class RefactoringCLI:
         
         guidance = self.current_package_results['guidance']
         
+        # Menu key -> (label, view), used both to render the menu and to
+        # dispatch the selected view
+        views = {
+            "1": ("🏥 Health Overview", self._show_package_health_detail),
+            "2": ("📊 Detailed Metrics", self._show_package_metrics_detail),
+            "3": ("🔍 Structural Issues", self._show_structural_issues),
+            "4": ("💡 Reorganization Suggestions", self._show_reorganization_suggestions),
+            "5": ("🔗 Dependency Graph", self._show_dependency_graph),
+            "6": ("⚠️  Circular Dependencies", self._show_circular_dependencies),
+            "7": ("📈 Priority Actions", self._show_priority_actions)
+        }
+        menu = "\n".join(
+            ["\n" + "="*60, "📦 [bold]Interactive Package Browser[/bold]", "="*60]
+            + [f"  {key}. {label}" for key, (label, _) in views.items()]
+        )
+        choices = list(views) + ["q"]
+        
         while True:
-            self.console.print("\n" + "="*60)
-            self.console.print("📦 [bold]Interactive Package Browser[/bold]")
-            self.console.print("="*60)
-            
-            options = {
-                "1": "🏥 Health Overview", 
-                "2": "📊 Detailed Metrics",
-                "3": "🔍 Structural Issues",
-                "4": "💡 Reorganization Suggestions",
-                "5": "🔗 Dependency Graph",
-                "6": "⚠️  Circular Dependencies",
-                "7": "📈 Priority Actions"
-            }
-            
-            for key, desc in options.items():
-                self.console.print(f"  {key}. {desc}")
+            self.console.print(menu)
             
             choice = Prompt.ask(
                 "\nSelect view",
-                choices=list(options.keys()) + ["q"],
+                choices=choices,
                 default="1"
             )
             
@@ -400,20 +391,8 @@ class RefactoringCLI:
             
             self.console.clear()
             
-            if choice == "1":
-                self._show_package_health_detail(guidance)
-            elif choice == "2":
-                self._show_package_metrics_detail(guidance)
-            elif choice == "3":
-                self._show_structural_issues(guidance)
-            elif choice == "4":
-                self._show_reorganization_suggestions(guidance)
-            elif choice == "5":
-                self._show_dependency_graph(guidance)
-            elif choice == "6":
-                self._show_circular_dependencies(guidance)
-            elif choice == "7":
-                self._show_priority_actions(guidance)
+            _, show_view = views[choice]
+            show_view(guidance)
             
             self.console.print("\n" + "-"*40)
             if not Confirm.ask("Continue browsing?", default=True):
@@ -478,12 +457,7 @@ Maintainability Rating: {guidance.maintainability_rating}
         issues_table.add_column("Affected Modules", style="blue")
         
         for issue in guidance.structural_issues:
-            severity_color = {
-                'critical': 'red',
-                'high': 'orange3',
-                'medium': 'yellow',
-                'low': 'blue'
-            }.get(issue.severity, 'white')
+            severity_color = _SEVERITY_COLORS[_SEVERITY_ORDINAL.get(issue.severity, _UNKNOWN_SEVERITY)]
             
             affected = ', '.join(issue.affected_modules[:2])  # Show first 2
             if len(issue.affected_modules) > 2:
@@ -505,12 +479,7 @@ Maintainability Rating: {guidance.maintainability_rating}
             return
         
         for i, suggestion in enumerate(guidance.reorganization_suggestions, 1):
-            priority_color = {
-                'critical': 'red',
-                'high': 'orange3', 
-                'medium': 'yellow',
-                'low': 'blue'
-            }.get(suggestion.priority, 'white')
+            priority_color = _SEVERITY_COLORS[_SEVERITY_ORDINAL.get(suggestion.priority, _UNKNOWN_SEVERITY)]
             
             suggestion_text = f"""
 🎯 Suggestion {i}: {suggestion.suggestion_type.replace('_', ' ').title()}
@@ -570,9 +539,10 @@ Maintainability Rating: {guidance.maintainability_rating}
             self.console.print("✅ No circular dependencies found!", style="green")
             return
         
-        for i, cycle in enumerate(guidance.circular_dependencies, 1):
-            cycle_text = " → ".join(cycle)
-            self.console.print(f"🔄 [red]Cycle {i}:[/red] {cycle_text}")
+        self.console.print("\n".join(
+            f"🔄 [red]Cycle {i}:[/red] {' → '.join(cycle)}"
+            for i, cycle in enumerate(guidance.circular_dependencies, 1)
+        ))
     
     def _show_priority_actions(self, guidance):
         """Show priority actions"""
@@ -622,18 +592,19 @@ Maintainability Rating: {guidance.maintainability_rating}
         ) as progress:
             
             task = progress.add_task("🔍 Scanning repository...", total=None)
-            
+
             try:
                 # Use the actual indexing method (we need to add this to AdvancedFeatures)
                 result = self._index_repository_with_progress(repo_path, db_path, progress, task)
-                
+
                 progress.update(task, description="✅ Indexing complete!")
-                
-                # Display results
-                self._display_indexing_results(result)
-                
+
             except Exception as e:
                 self.console.print(f"❌ Indexing failed: {str(e)}", style="bold red")
+                return
+
+        # Display results once the live progress display has stopped refreshing
+        self._display_indexing_results(result)
     
     def _index_repository_with_progress(self, repo_path: str, db_path: str, progress, task) -> Dict[str, Any]:
         """Index repository with progress updates"""
@@ -848,7 +819,7 @@ def analyze(ctx, file_path: str, interactive: bool, format: str):
             **results,
             'guidance': [g.to_dict() for g in results.get('guidance', [])]
         }
-        click.echo(json.dumps(json_results, indent=2))
+        click.echo(dumps_json(json_results))
     elif format == 'detailed':
         cli_tool.display_analysis_summary(results)
         for guidance in results.get('guidance', []):
@@ -923,7 +894,7 @@ def analyze_package(ctx, package_path: str, name: str, interactive: bool, format
             "guidance": results['guidance'].to_dict(),
             "summary": results['summary']
         }
-        click.echo(json.dumps(json_results, indent=2, default=str))
+        click.echo(dumps_json(json_results, default=str))
     elif format == 'detailed':
         cli_tool.display_package_summary(results)
         if interactive:
@@ -965,7 +936,7 @@ def package_metrics(ctx, package_path: str, name: str, format: str):
                 "rating": guidance.maintainability_rating
             }
         }
-        click.echo(json.dumps(metrics_result, indent=2, default=str))
+        click.echo(dumps_json(metrics_result, default=str))
     else:
         # Show detailed metrics in table format
         console.print(f"\n📊 [bold]Package Metrics: {guidance.package_name}[/bold]")
@@ -1010,7 +981,7 @@ def package_issues(ctx, package_path: str, types: tuple, severity: str, format:
             "issues": [issue.to_dict() for issue in issues],
             "reorganization_suggestions": [suggestion.to_dict() for suggestion in guidance.reorganization_suggestions]
         }
-        click.echo(json.dumps(issues_result, indent=2, default=str))
+        click.echo(dumps_json(issues_result, default=str))
     else:
         console.print(f"\n🔍 [bold]Structural Issues: {guidance.package_name}[/bold]")
         if not issues:
@@ -1057,7 +1028,7 @@ def package_dependencies(ctx, package_path: str, show_circular: bool, format: st
                 "standard": len([d for d in guidance.dependencies if d.import_type == 'standard'])
             }
         }
-        click.echo(json.dumps(deps_result, indent=2, default=str))
+        click.echo(dumps_json(deps_result, default=str))
     elif format == 'detailed':
         console.print(f"\n🔗 [bold]Dependencies: {guidance.package_name}[/bold]")
         cli_tool._show_dependency_graph(guidance)
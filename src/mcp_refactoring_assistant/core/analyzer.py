@@ -5,7 +5,8 @@ Enhanced refactoring analyzer orchestrator
 
 import ast
 import tempfile
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple, Union
 
 from ..models import RefactoringGuidance
 from ..analyzers import (
@@ -20,6 +21,21 @@ from ..analyzers import (
 )
 
 
+# Each entry pins a full source string and its tree for the life of the
+# process, so only the last few distinct sources are kept
+@lru_cache(maxsize=8)
+def _parse(content: str) -> Union[ast.AST, SyntaxError]:
+    """Parse source once per distinct content, caching syntax errors too
+
+    The tree is shared between callers; analyzers must not modify it
+    (see BaseAnalyzer._safe_analyze).
+    """
+    try:
+        return ast.parse(content)
+    except SyntaxError as e:
+        return e.with_traceback(None)
+
+
 class EnhancedRefactoringAnalyzer:
     """Professional refactoring analyzer orchestrating multiple third-party libraries"""
 
@@ -40,33 +56,49 @@ class EnhancedRefactoringAnalyzer:
 
     def analyze_file(self, file_path: str, content: str) -> List[RefactoringGuidance]:
         """Comprehensive file analysis using all available tools"""
+        # Parse AST once for efficiency, reusing earlier parses of the same source
+        tree = _parse(content)
+        if isinstance(tree, SyntaxError):
+            return [self._syntax_error_guidance(tree)]
+
+        return self._run_analyzers(file_path, content, tree)
+
+    def analyze_files(
+        self, files: Iterable[Tuple[str, str]]
+    ) -> List[List[RefactoringGuidance]]:
+        """Analyze several (file_path, content) pairs in one call
+
+        Returns one guidance list per file, in order. Files with identical
+        content share a single parse; the analyzers only read the tree.
+        """
+        return [self.analyze_file(file_path, content) for file_path, content in files]
+
+    def _run_analyzers(
+        self, file_path: str, content: str, tree: ast.AST
+    ) -> List[RefactoringGuidance]:
+        """Run every analyzer over an already parsed file"""
         guidance_list = []
 
-        try:
-            # Parse AST once for efficiency
-            tree = ast.parse(content)
-            
-            # Run all analyzers
-            for analyzer in self.analyzers:
-                try:
-                    analyzer_guidance = analyzer._safe_analyze(content, file_path, tree)
-                    guidance_list.extend(analyzer_guidance)
-                except Exception as e:
-                    print(f"Warning: {analyzer.name} failed: {e}")
-                    continue
-
-        except SyntaxError as e:
-            guidance_list.append(
-                RefactoringGuidance(
-                    issue_type="syntax_error",
-                    severity="critical",
-                    location=f"Line {e.lineno}",
-                    description=f"Syntax error prevents analysis: {e}",
-                    benefits=["Enable proper code analysis"],
-                    precise_steps=[
-                        "Fix syntax error before proceeding with refactoring"
-                    ],
-                )
-            )
-
-        return guidance_list
\ No newline at end of file
+        for analyzer in self.analyzers:
+            try:
+                analyzer_guidance = analyzer._safe_analyze(content, file_path, tree)
+                guidance_list.extend(analyzer_guidance)
+            except Exception as e:
+                print(f"Warning: {analyzer.name} failed: {e}")
+                continue
+
+        return guidance_list
+
+    @staticmethod
+    def _syntax_error_guidance(error: SyntaxError) -> RefactoringGuidance:
+        """Critical guidance reporting code that cannot be parsed"""
+        return RefactoringGuidance(
+            issue_type="syntax_error",
+            severity="critical",
+            location=f"Line {error.lineno}",
+            description=f"Syntax error prevents analysis: {error}",
+            benefits=["Enable proper code analysis"],
+            precise_steps=[
+                "Fix syntax error before proceeding with refactoring"
+            ],
+        )
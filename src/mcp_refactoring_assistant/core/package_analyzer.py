@@ -23,6 +23,7 @@ from ..analyzers.package import (
     PackageStructureAnalyzer
 )
 from ..analyzers import RadonAnalyzer, VultureAnalyzer
+from ..analyzers.package.source_cache import SourceCache, read_source_file
 
 
 class PackageAnalyzer:
@@ -62,26 +63,29 @@ class PackageAnalyzer:
         if package_name is None:
             package_name = package_path.name
         
+        # Every step reads the same files; share the reads for this call only
+        source_cache: SourceCache = {}
+        
         # Step 1: Analyze dependencies
         print(f"Analyzing dependencies for {package_name}...")
-        dependency_graph = self.dependency_analyzer.analyze_package_dependencies(str(package_path))
+        dependency_graph = self.dependency_analyzer.analyze_package_dependencies(str(package_path), source_cache)
         
         # Step 2: Calculate aggregated metrics
         print(f"Calculating package metrics...")
-        package_metrics = self._calculate_package_metrics(package_path, dependency_graph)
+        package_metrics = self._calculate_package_metrics(package_path, dependency_graph, source_cache)
         
         # Step 3: Analyze cohesion
         print(f"Analyzing package cohesion...")
-        cohesion_metrics = self.cohesion_analyzer.analyze_package_cohesion(str(package_path), package_name)
+        cohesion_metrics = self.cohesion_analyzer.analyze_package_cohesion(str(package_path), package_name, source_cache)
         
         # Step 4: Analyze coupling
         print(f"Analyzing package coupling...")
-        coupling_metrics = self.coupling_analyzer.analyze_package_coupling(str(package_path), package_name, dependency_graph)
+        coupling_metrics = self.coupling_analyzer.analyze_package_coupling(str(package_path), package_name, dependency_graph, source_cache)
         
         # Step 5: Analyze structure and detect issues
         print(f"Analyzing package structure...")
         structural_issues, reorganization_suggestions = self.structure_analyzer.analyze_package_structure(
-            str(package_path), dependency_graph
+            str(package_path), dependency_graph, source_cache
         )
         
         # Step 6: Generate prioritized recommendations
@@ -107,7 +111,8 @@ class PackageAnalyzer:
         
         return guidance
     
-    def _calculate_package_metrics(self, package_path: Path, dependency_graph: DependencyGraph) -> PackageMetrics:
+    def _calculate_package_metrics(self, package_path: Path, dependency_graph: DependencyGraph,
+                                   source_cache: Optional[SourceCache] = None) -> PackageMetrics:
         """Calculate aggregated metrics for the package"""
         metrics = PackageMetrics()
         
@@ -125,8 +130,7 @@ class PackageAnalyzer:
         
         for file_path in python_files:
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
+                content = read_source_file(file_path, source_cache)
                 
                 # Count lines, functions, classes
                 metrics.total_lines += len(content.splitlines())
@@ -8,7 +8,6 @@ import asyncio
 import json
 import sys
 import ast
-import re
 from typing import Any, Dict, List, Optional
 
 # Import MCP with SSE support
@@ -22,6 +21,11 @@ except ImportError as e:
     MCP_AVAILABLE = False
     print(f"MCP not available: {e}")
 
+try:
+    from .serialization import dumps_json
+except ImportError:
+    from mcp_refactoring_assistant.serialization import dumps_json
+
 # Import analyzer
 try:
     from .server import EnhancedRefactoringAnalyzer
@@ -47,24 +51,17 @@ class CodeRefactorer:
         
         # Create function signature
         params_str = ', '.join(parameters) if parameters else ''
-        function_def = f"def {function_name}({params_str}):\n"
+        function_lines = [f"def {function_name}({params_str}):"]
         
         # Indent extracted code
-        indented_code = '\n'.join(f"    {line}" for line in extracted_lines)
+        function_lines.extend(f"    {line}" for line in extracted_lines)
         
         # Add return statement
         if return_vars:
-            if len(return_vars) == 1:
-                return_stmt = f"    return {return_vars[0]}"
-            else:
-                return_stmt = f"    return {', '.join(return_vars)}"
-        else:
-            return_stmt = ""
+            function_lines.append(f"    return {', '.join(return_vars)}")
         
-        # Complete function
-        new_function = function_def + indented_code
-        if return_stmt:
-            new_function += "\n" + return_stmt
+        # Complete function, joined once rather than concatenated piecewise
+        new_function = '\n'.join(function_lines)
         
         # Create function call
         if return_vars:
@@ -305,7 +302,7 @@ if MCP_AVAILABLE:
                 
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=dumps_json(result)
                 )]
             
             elif name == "extract_function":
@@ -389,7 +386,7 @@ if MCP_AVAILABLE:
                 
                 return [types.TextContent(
                     type="text",
-                    text=json.dumps(result, indent=2)
+                    text=dumps_json(result)
                 )]
             
             elif name == "quick_analyze":
@@ -431,7 +428,7 @@ if MCP_AVAILABLE:
                     
                     return [types.TextContent(
                         type="text",
-                        text=json.dumps(quick_results, indent=2)
+                        text=dumps_json(quick_results)
                     )]
                     
                 except SyntaxError as e:
@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+JSON serialization shared by the CLI and MCP servers
+"""
+
+import json
+from typing import Any, Callable, Optional
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps_json(data: Any, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize analysis results as indented JSON
+
+    Uses orjson when it is installed and falls back to the stdlib json module
+    otherwise. Both parse back to the same value as json.dumps(data, indent=2),
+    but orjson writes non-ASCII text as UTF-8 instead of \\u escapes and writes
+    NaN and infinities as null.
+
+    Args:
+        data: JSON-compatible data to serialize
+        default: Called for values that are not natively serializable; without
+            it such values raise TypeError, as with json.dumps
+
+    Returns:
+        The JSON document as a string
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(
+            data, default=default, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    return json.dumps(data, indent=2, default=default)
@@ -15,12 +15,16 @@ import os
 import subprocess
 import sys
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 # Import the new modular components
 from .core import EnhancedRefactoringAnalyzer
 from .core.package_analyzer import PackageAnalyzer
 from .analyzers import SecurityAndPatternsAnalyzer
+from .serialization import dumps_json
+
+# Nodes that add one decision point to cyclomatic complexity
+_BRANCH_NODES = (ast.If, ast.While, ast.For, ast.ExceptHandler)
 
 
 class AdvancedFeatures:
@@ -94,14 +98,14 @@ class AdvancedFeatures:
         except Exception as e:
             result["error"] = f"Error running tests: {e}"
     
-    def _get_source_files(self, source_path: str) -> List[str]:
-        """Get list of source files to analyze"""
+    def _get_source_files(self, source_path: str) -> Iterator[str]:
+        """Lazily yield source files to analyze"""
         if os.path.isfile(source_path):
-            return [source_path]
+            return iter([source_path])
         else:
-            return glob.glob(f"{source_path}/**/*.py", recursive=True)
+            return glob.iglob(f"{source_path}/**/*.py", recursive=True)
     
-    def _analyze_source_files(self, source_files: List[str], result: Dict[str, Any]) -> None:
+    def _analyze_source_files(self, source_files: Iterable[str], result: Dict[str, Any]) -> None:
         """Analyze source files for testing needs"""
         for file_path in source_files:
             if "__pycache__" in file_path or file_path.endswith("__init__.py"):
@@ -328,7 +332,7 @@ class AdvancedFeatures:
         complexity = 1  # Base complexity
         
         for child in ast.walk(node):
-            if isinstance(child, (ast.If, ast.While, ast.For, ast.ExceptHandler)):
+            if isinstance(child, _BRANCH_NODES):
                 complexity += 1
             elif isinstance(child, ast.BoolOp):
                 complexity += len(child.values) - 1
@@ -588,7 +592,7 @@ if MCP_AVAILABLE:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             elif name == "find_long_functions":
@@ -629,7 +633,7 @@ if MCP_AVAILABLE:
 
                     return [
                         types.TextContent(
-                            type="text", text=json.dumps(result, indent=2)
+                            type="text", text=dumps_json(result)
                         )
                     ]
 
@@ -661,7 +665,7 @@ if MCP_AVAILABLE:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             elif name == "analyze_test_coverage":
@@ -673,7 +677,7 @@ if MCP_AVAILABLE:
                 coverage_analysis = advanced_features.analyze_test_coverage(source_path, test_path, target_coverage)
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(coverage_analysis, indent=2))
+                    types.TextContent(type="text", text=dumps_json(coverage_analysis))
                 ]
 
             elif name == "tdd_refactoring_guidance":
@@ -685,7 +689,7 @@ if MCP_AVAILABLE:
                 tdd_guidance = advanced_features.generate_tdd_refactoring_guidance(content, function_name, test_path)
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(tdd_guidance, indent=2))
+                    types.TextContent(type="text", text=dumps_json(tdd_guidance))
                 ]
 
             elif name == "analyze_python_package":
@@ -714,7 +718,7 @@ if MCP_AVAILABLE:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             elif name == "get_package_metrics":
@@ -748,7 +752,7 @@ if MCP_AVAILABLE:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             elif name == "find_package_issues":
@@ -790,7 +794,7 @@ if MCP_AVAILABLE:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             elif name == "analyze_security_and_patterns":
@@ -840,7 +844,7 @@ if MCP_AVAILABLE:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             else:
@@ -906,7 +910,7 @@ else:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             elif name == "analyze_security_and_patterns":
@@ -956,7 +960,7 @@ else:
                 }
 
                 return [
-                    types.TextContent(type="text", text=json.dumps(result, indent=2))
+                    types.TextContent(type="text", text=dumps_json(result))
                 ]
 
             else:
@@ -3,59 +3,96 @@
 Shared pytest fixtures and configuration for mcp-python-refactoring tests.
 """
 
+import ast
+import copy
+import itertools
+import operator
 import pytest
-import tempfile
 import os
-import sys
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Callable
-from unittest.mock import Mock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Dict, List, Optional, Callable, Tuple, Union
 import json
 
-# Add src to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
-from mcp_refactoring_assistant.models import RefactoringGuidance, ExtractableBlock
+# The analyzer stack is imported inside the fixtures that need it so that
+# collection and runs that never touch it do not pay for loading it
 
 
 # ===== BASIC FIXTURES =====
 
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        yield Path(tmp_dir)
+    return tmp_path
 
 
-@pytest.fixture
-def temp_file(temp_dir):
+@pytest.fixture(scope="session")
+def shared_tmp_dir(tmp_path_factory):
+    """Temporary directory shared by the whole session for temp_file."""
+    return tmp_path_factory.mktemp("func")
+
+
+@pytest.fixture(scope="session")
+def empty_project_dir(tmp_path_factory):
+    """Project directory that no fixture or test ever writes into."""
+    return tmp_path_factory.mktemp("empty_project")
+
+
+@pytest.fixture(scope="session")
+def temp_file(shared_tmp_dir):
     """Create a temporary Python file for testing."""
-    def _create_file(content: str, filename: str = "test.py") -> Path:
-        file_path = temp_dir / filename
-        file_path.write_text(content)
+    counter = itertools.count()
+    
+    def _create_file(content: Union[str, bytes], filename: str = "test.py") -> Path:
+        # Each file gets its own subdirectory so the exact name is kept
+        # without colliding with files from other tests
+        file_dir = shared_tmp_dir / str(next(counter))
+        file_dir.mkdir()
+        file_path = file_dir / filename
+        # Pre-encoded content is written as-is, skipping the per-call encode
+        if isinstance(content, bytes):
+            file_path.write_bytes(content)
+        else:
+            file_path.write_text(content)
         return file_path
     return _create_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def analyzer():
-    """Create an EnhancedRefactoringAnalyzer instance for testing."""
+    """Shared EnhancedRefactoringAnalyzer instance for the whole session.
+
+    Building the analyzer sets up every sub-analyzer (including a Rope
+    project), so it is created once, on first use. Under pytest-xdist each
+    worker is its own session, so only the workers that run an analyzer test
+    build one. Tests must not modify it; use ``analyzer_isolated`` for that.
+    """
+    from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
     return EnhancedRefactoringAnalyzer()
 
 
 @pytest.fixture
-def analyzer_with_path(temp_dir):
+def analyzer_isolated():
+    """Create a fresh analyzer for tests that modify analyzer state."""
+    from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
+    return EnhancedRefactoringAnalyzer()
+
+
+@pytest.fixture
+def analyzer_with_path(temp_dir, analyzer):
     """Create an analyzer with a specific project path."""
-    return EnhancedRefactoringAnalyzer(project_path=str(temp_dir))
+    analyzer_copy = copy.copy(analyzer)
+    analyzer_copy.project_path = str(temp_dir)
+    return analyzer_copy
 
 
 # ===== CODE SAMPLE FIXTURES =====
 
-@pytest.fixture
-def simple_function_code():
-    """Simple, clean function code."""
-    return '''
+_SIMPLE_FUNCTION_CODE = '''
 def greet(name):
     """Return a greeting message."""
     return f"Hello, {name}!"
@@ -65,11 +102,7 @@ def calculate_area(width, height):
     return width * height
 '''
 
-
-@pytest.fixture
-def complex_function_code():
-    """Complex function with multiple issues."""
-    return '''
+_COMPLEX_FUNCTION_CODE = '''
 def complex_calculation(a, b, c, d, e, f, g, h, i, j):
     """Function with too many parameters and high complexity."""
     result = []
@@ -98,79 +131,70 @@ def complex_calculation(a, b, c, d, e, f, g, h, i, j):
     return result
 '''
 
+_LONG_FUNCTION_CODE = "\n".join([
+    "def process_data(data):",
+    '    """Process data with many steps."""',
+    "    # Data validation",
+    "    if not data:",
+    "        raise ValueError('Data cannot be empty')",
+    "",
+    "    # Data cleaning",
+    "    cleaned_data = []",
+    "    for item in data:",
+    "        if item is not None:",
+    "            cleaned_data.append(str(item).strip())",
+    "",
+    "    # Data transformation",
+    "    transformed_data = []",
+    "    for item in cleaned_data:",
+    "        if item.isdigit():",
+    "            transformed_data.append(int(item))",
+    "        else:",
+    "            transformed_data.append(item.upper())",
+    "",
+    "    # Data aggregation",
+    "    numbers = [x for x in transformed_data if isinstance(x, int)]",
+    "    strings = [x for x in transformed_data if isinstance(x, str)]",
+    "",
+    "    # Statistical calculations",
+    "    if numbers:",
+    "        avg = sum(numbers) / len(numbers)",
+    "        max_val = max(numbers)",
+    "        min_val = min(numbers)",
+    "    else:",
+    "        avg = max_val = min_val = 0",
+    "",
+    "    # String processing",
+    "    if strings:",
+    "        longest_string = max(strings, key=len)",
+    "        shortest_string = min(strings, key=len)",
+    "        total_length = sum(len(s) for s in strings)",
+    "    else:",
+    "        longest_string = shortest_string = ''",
+    "        total_length = 0",
+    "",
+    "    # Result compilation",
+    "    result = {",
+    "        'numbers': numbers,",
+    "        'strings': strings,",
+    "        'stats': {",
+    "            'avg': avg,",
+    "            'max': max_val,",
+    "            'min': min_val,",
+    "            'longest_string': longest_string,",
+    "            'shortest_string': shortest_string,",
+    "            'total_length': total_length",
+    "        }",
+    "    }",
+    "",
+    "    # Final validation",
+    "    if not result['numbers'] and not result['strings']:",
+    "        raise ValueError('No valid data found')",
+    "",
+    "    return result"
+])
 
-@pytest.fixture
-def long_function_code():
-    """Long function suitable for extract method refactoring."""
-    lines = [
-        "def process_data(data):",
-        '    """Process data with many steps."""',
-        "    # Data validation",
-        "    if not data:",
-        "        raise ValueError('Data cannot be empty')",
-        "",
-        "    # Data cleaning",
-        "    cleaned_data = []",
-        "    for item in data:",
-        "        if item is not None:",
-        "            cleaned_data.append(str(item).strip())",
-        "",
-        "    # Data transformation",
-        "    transformed_data = []",
-        "    for item in cleaned_data:",
-        "        if item.isdigit():",
-        "            transformed_data.append(int(item))",
-        "        else:",
-            "            transformed_data.append(item.upper())",
-        "",
-        "    # Data aggregation",
-        "    numbers = [x for x in transformed_data if isinstance(x, int)]",
-        "    strings = [x for x in transformed_data if isinstance(x, str)]",
-        "",
-        "    # Statistical calculations",
-        "    if numbers:",
-        "        avg = sum(numbers) / len(numbers)",
-        "        max_val = max(numbers)",
-        "        min_val = min(numbers)",
-        "    else:",
-        "        avg = max_val = min_val = 0",
-        "",
-        "    # String processing",
-        "    if strings:",
-        "        longest_string = max(strings, key=len)",
-        "        shortest_string = min(strings, key=len)",
-        "        total_length = sum(len(s) for s in strings)",
-        "    else:",
-        "        longest_string = shortest_string = ''",
-        "        total_length = 0",
-        "",
-        "    # Result compilation",
-        "    result = {",
-        "        'numbers': numbers,",
-        "        'strings': strings,",
-        "        'stats': {",
-        "            'avg': avg,",
-        "            'max': max_val,",
-        "            'min': min_val,",
-        "            'longest_string': longest_string,",
-        "            'shortest_string': shortest_string,",
-        "            'total_length': total_length",
-        "        }",
-        "    }",
-        "",
-        "    # Final validation",
-        "    if not result['numbers'] and not result['strings']:",
-        "        raise ValueError('No valid data found')",
-        "",
-        "    return result"
-    ]
-    return '\n'.join(lines)
-
-
-@pytest.fixture
-def class_with_methods_code():
-    """Class with multiple methods for testing."""
-    return '''
+_CLASS_WITH_METHODS_CODE = '''
 class DataProcessor:
     """A class for processing data."""
     
@@ -214,11 +238,7 @@ class DataProcessor:
         return {'count': 0, 'sum': 0, 'avg': 0}
 '''
 
-
-@pytest.fixture
-def syntax_error_code():
-    """Code with syntax errors."""
-    return '''
+_SYNTAX_ERROR_CODE = '''
 def broken_function(
     # Missing closing parenthesis
     return "This will fail"
@@ -229,11 +249,7 @@ def another_broken():
         print("broken")
 '''
 
-
-@pytest.fixture
-def dead_code_sample():
-    """Code with unused functions."""
-    return '''
+_DEAD_CODE_SAMPLE = '''
 def used_function():
     """This function is called."""
     return "used"
@@ -256,110 +272,184 @@ if __name__ == "__main__":
     main()
 '''
 
+# Valid code samples by name, as exposed parsed through ``sample_asts``
+_SAMPLES = {
+    "simple_function": _SIMPLE_FUNCTION_CODE,
+    "complex_function": _COMPLEX_FUNCTION_CODE,
+    "long_function": _LONG_FUNCTION_CODE,
+    "class_with_methods": _CLASS_WITH_METHODS_CODE,
+    "dead_code": _DEAD_CODE_SAMPLE,
+}
+
+
+@pytest.fixture(scope="session")
+def simple_function_code():
+    """Simple, clean function code."""
+    return _SIMPLE_FUNCTION_CODE
+
+
+@pytest.fixture(scope="session")
+def complex_function_code():
+    """Complex function with multiple issues."""
+    return _COMPLEX_FUNCTION_CODE
+
+
+@pytest.fixture(scope="session")
+def long_function_code():
+    """Long function suitable for extract method refactoring."""
+    return _LONG_FUNCTION_CODE
+
+
+@pytest.fixture(scope="session")
+def class_with_methods_code():
+    """Class with multiple methods for testing."""
+    return _CLASS_WITH_METHODS_CODE
+
+
+@pytest.fixture(scope="session")
+def syntax_error_code():
+    """Code with syntax errors."""
+    return _SYNTAX_ERROR_CODE
+
+
+@pytest.fixture(scope="session")
+def dead_code_sample():
+    """Code with unused functions."""
+    return _DEAD_CODE_SAMPLE
+
+
+@pytest.fixture(scope="session")
+def sample_asts():
+    """Parsed ASTs of the valid code samples, keyed by sample name.
+
+    Parsed once per session; the trees are shared, so tests must not modify them.
+    """
+    return {name: ast.parse(source) for name, source in _SAMPLES.items()}
+
+
+@pytest.fixture(scope="session")
+def sample_code_files():
+    """Contents of the tests/fixtures/sample_code files, keyed by file stem.
+
+    Each file is read once per session.
+    """
+    sample_dir = Path(__file__).parent / "fixtures" / "sample_code"
+    return {path.stem: path.read_text() for path in sorted(sample_dir.glob("*.py"))}
+
 
 # ===== CODE FACTORY FIXTURES =====
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def code_factory():
     """Factory for generating test code with specific characteristics."""
     
-    def _make_function(self, name: str = "test_func", 
+    def make_function(name: str = "test_func", 
                       params: int = 2, 
                       complexity: int = 1, 
                       lines: int = 10) -> str:
         """Generate a function with specified characteristics."""
-        param_list = ", ".join([f"param{i}" for i in range(1, params + 1)])
-        
-        header = f"def {name}({param_list}):"
-        docstring = f'    """Generated function with {params} params, complexity {complexity}."""'
-        
-        body_lines = []
+        param_list = ", ".join(f"param{i}" for i in range(1, params + 1))
+        indents = ["    " * (depth + 1) for depth in range(complexity + 1)]
         
         # Add complexity through nested conditions
-        indent = "    "
-        for i in range(complexity):
-            condition = f"{indent}if param1 > {i}:"
-            body_lines.append(condition)
-            indent += "    "
+        body_lines = [f"{indents[i]}if param1 > {i}:" for i in range(complexity)]
         
         # Add remaining lines
-        remaining_lines = max(1, lines - len(body_lines) - 2)  # -2 for header and docstring
-        for i in range(remaining_lines):
-            body_lines.append(f"{indent}result_{i} = param1 + {i}")
+        body_indent = indents[complexity]
+        remaining_lines = max(1, lines - complexity - 2)  # -2 for header and docstring
+        body_lines.extend(f"{body_indent}result_{i} = param1 + {i}" for i in range(remaining_lines))
+        body_lines.append(f"{body_indent}return result_0")
         
-        body_lines.append(f"{indent}return result_0")
-        
-        return "\n".join([header, docstring] + body_lines)
+        return "\n".join([
+            f"def {name}({param_list}):",
+            f'    """Generated function with {params} params, complexity {complexity}."""',
+            *body_lines,
+        ])
     
-    def _make_class(self, name: str = "TestClass", 
+    def make_class(name: str = "TestClass", 
                    methods: int = 3,
                    complexity: int = 1) -> str:
         """Generate a class with specified characteristics."""
-        lines = [f"class {name}:", f'    """Generated class with {methods} methods."""', ""]
-        
-        # Add constructor
-        lines.extend([
+        lines = [
+            f"class {name}:",
+            f'    """Generated class with {methods} methods."""',
+            "",
+            # Add constructor
             "    def __init__(self):",
             "        self.value = 0",
-            ""
-        ])
+            "",
+        ]
         
         # Add methods
         for i in range(methods):
-            method_code = _make_function(self, name=f"method_{i}", params=2, complexity=complexity, lines=5)
+            method_code = make_function(name=f"method_{i}", params=2, complexity=complexity, lines=5)
             # Indent method code
-            method_lines = [f"    {line}" if line.strip() else "" for line in method_code.split('\n')]
-            lines.extend(method_lines)
+            lines.extend(f"    {line}" if line.strip() else "" for line in method_code.split('\n'))
             lines.append("")
         
         return "\n".join(lines)
     
-    return type('CodeFactory', (), {
-        'make_function': _make_function,
-        'make_class': _make_class
-    })()
+    return SimpleNamespace(make_function=make_function, make_class=make_class)
 
 
 # ===== PARAMETER FIXTURES =====
 
-@pytest.fixture(params=[
+_FUNCTION_SAMPLES = (
     ("simple", "def simple(): return True"),
     ("with_params", "def with_params(a, b): return a + b"),
     ("with_docstring", 'def with_docstring():\n    """Test function"""\n    return True'),
-    ("empty_body", "def empty_body(): pass")
-])
-def function_samples(request):
-    """Parametrized fixture providing various function samples."""
-    name, code = request.param
-    return {"name": name, "code": code}
-
-
-@pytest.fixture(params=[1, 3, 5, 10])
-def complexity_levels(request):
-    """Different complexity levels for testing."""
-    return request.param
+    ("empty_body", "def empty_body(): pass"),
+)
+_COMPLEXITY_LEVELS = (1, 3, 5, 10)
+_FUNCTION_LENGTHS = (10, 25, 50, 100)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize tests requesting function_samples, complexity_levels or function_lengths.
+
+    - function_samples: various function samples as {"name", "code"} dicts
+    - complexity_levels: different complexity levels for testing
+    - function_lengths: different function lengths for testing
+    """
+    if "function_samples" in metafunc.fixturenames:
+        metafunc.parametrize(
+            "function_samples",
+            [{"name": name, "code": code} for name, code in _FUNCTION_SAMPLES],
+            ids=[name for name, _ in _FUNCTION_SAMPLES],
+            scope="session",
+        )
+    if "complexity_levels" in metafunc.fixturenames:
+        metafunc.parametrize("complexity_levels", _COMPLEXITY_LEVELS, scope="session")
+    if "function_lengths" in metafunc.fixturenames:
+        metafunc.parametrize("function_lengths", _FUNCTION_LENGTHS, scope="session")
 
 
-@pytest.fixture(params=[10, 25, 50, 100])
-def function_lengths(request):
-    """Different function lengths for testing."""
-    return request.param
+# ===== MOCK FIXTURES =====
 
+class _StubAnalyzer:
+    """Stand-in for EnhancedRefactoringAnalyzer that finds no issues."""
+    
+    project_path = "/mock/path"
+    
+    def analyze_file(self, file_path: str, content: str) -> list:
+        return []
 
-# ===== MOCK FIXTURES =====
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_analyzer():
-    """Mock analyzer for testing without real analysis."""
-    mock = Mock(spec=EnhancedRefactoringAnalyzer)
-    mock.analyze_file.return_value = []
-    mock.project_path = "/mock/path"
-    return mock
+    """Stub analyzer for testing without real analysis."""
+    return _StubAnalyzer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_guidance():
-    """Mock RefactoringGuidance objects."""
+    """Mock RefactoringGuidance objects.
+
+    Each object is built and validated on its own, so bad test data such as
+    an unknown severity fails loudly and no list is shared between objects.
+    """
+    from mcp_refactoring_assistant.models import RefactoringGuidance
+    
     def _create_guidance(issue_type: str = "test_issue",
                         severity: str = "medium",
                         description: str = "Test description") -> RefactoringGuidance:
@@ -375,36 +465,53 @@ def mock_guidance():
     return _create_guidance
 
 
-@pytest.fixture
+_MCP_TOOLS = (
+    {"name": "analyze_python_code"},
+    {"name": "extract_function"},
+    {"name": "quick_analyze"},
+)
+
+
+class _FakeMCPServer:
+    """Stand-in for the MCP server that only lists its tools."""
+    
+    def list_tools(self) -> tuple:
+        return _MCP_TOOLS
+
+
+@pytest.fixture(scope="session")
 def mock_mcp_server():
-    """Mock MCP server for protocol testing."""
-    server_mock = Mock()
-    server_mock.list_tools.return_value = [
-        {"name": "analyze_python_code"},
-        {"name": "extract_function"},
-        {"name": "quick_analyze"}
-    ]
-    return server_mock
+    """Fake MCP server for protocol testing."""
+    return _FakeMCPServer()
 
 
 # ===== ASSERTION HELPERS =====
 
-@pytest.fixture
+_VALID_SEVERITIES = frozenset({"low", "medium", "high", "critical"})
+_GUIDANCE_FIELDS = operator.attrgetter(
+    "issue_type", "severity", "location", "description", "benefits", "precise_steps"
+)
+
+
+@pytest.fixture(scope="session")
 def guidance_validator():
     """Helper for validating RefactoringGuidance objects."""
+    from mcp_refactoring_assistant.models import RefactoringGuidance
     
     def validate(guidance: List[RefactoringGuidance]) -> None:
         """Validate a list of RefactoringGuidance objects."""
         assert isinstance(guidance, list)
         
         for item in guidance:
+            # The model guarantees these attributes exist; check their values
             assert isinstance(item, RefactoringGuidance)
-            assert hasattr(item, 'issue_type') and item.issue_type
-            assert hasattr(item, 'severity') and item.severity in ['low', 'medium', 'high', 'critical']
-            assert hasattr(item, 'location') and item.location
-            assert hasattr(item, 'description') and item.description
-            assert hasattr(item, 'benefits') and isinstance(item.benefits, list)
-            assert hasattr(item, 'precise_steps') and isinstance(item.precise_steps, list)
+            issue_type, severity, location, description, benefits, precise_steps = _GUIDANCE_FIELDS(item)
+            assert issue_type
+            assert severity in _VALID_SEVERITIES
+            assert location
+            assert description
+            assert isinstance(benefits, list)
+            assert isinstance(precise_steps, list)
             
             # Validate dict conversion
             item_dict = item.to_dict()
@@ -415,74 +522,91 @@ def guidance_validator():
     return validate
 
 
-@pytest.fixture
-def performance_timer():
-    """Helper for timing operations."""
-    import time
+class _Timer:
+    """Context manager measuring elapsed time on the monotonic perf counter."""
     
-    class Timer:
-        def __init__(self):
-            self.start_time = None
-            self.end_time = None
-        
-        def __enter__(self):
-            self.start_time = time.time()
-            return self
-        
-        def __exit__(self, *args):
-            self.end_time = time.time()
-        
-        @property
-        def elapsed(self) -> float:
-            if self.start_time and self.end_time:
-                return self.end_time - self.start_time
-            return 0.0
+    __slots__ = ("start_ns", "end_ns")
+    
+    def __init__(self):
+        self.start_ns = None
+        self.end_ns = None
+    
+    def __enter__(self):
+        self.start_ns = time.perf_counter_ns()
+        return self
+    
+    def __exit__(self, *args):
+        self.end_ns = time.perf_counter_ns()
     
-    return Timer
+    @property
+    def elapsed(self) -> float:
+        """Elapsed seconds, or 0.0 if the timed block has not finished."""
+        if self.start_ns is not None and self.end_ns is not None:
+            return (self.end_ns - self.start_ns) / 1e9
+        return 0.0
+
+
+@pytest.fixture(scope="session")
+def performance_timer():
+    """Helper for timing operations."""
+    return _Timer
+
+
+@pytest.fixture(scope="session")
+def thread_pool():
+    """Thread pool shared by the whole session for concurrency tests."""
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        yield pool
 
 
 # ===== FILE SYSTEM FIXTURES =====
 
-@pytest.fixture
-def test_project_structure(temp_dir):
-    """Create a realistic project structure for testing."""
-    # Create directories
-    (temp_dir / "src").mkdir()
-    (temp_dir / "src" / "myproject").mkdir()
-    (temp_dir / "tests").mkdir()
-    (temp_dir / "docs").mkdir()
-    
-    # Create Python files
-    files_to_create = {
-        "src/myproject/__init__.py": "",
-        "src/myproject/main.py": '''
+_PROJECT_FILES = {
+    "src/myproject/__init__.py": "",
+    "src/myproject/main.py": '''
 def main():
     print("Hello, World!")
 
 if __name__ == "__main__":
     main()
 ''',
-        "src/myproject/utils.py": '''
+    "src/myproject/utils.py": '''
 def add(a, b):
     return a + b
 
 def multiply(a, b):
     return a * b
 ''',
-        "tests/__init__.py": "",
-        "tests/test_main.py": '''
+    "tests/__init__.py": "",
+    "tests/test_main.py": '''
 def test_main():
     assert True
 ''',
-        "README.md": "# Test Project",
-        "requirements.txt": "pytest\nrequests"
-    }
+    "README.md": "# Test Project",
+    "requirements.txt": "pytest\nrequests"
+}
+
+
+@pytest.fixture(scope="session")
+def _project_template(tmp_path_factory):
+    """Write the sample project once per session for tests to copy."""
+    template_dir = tmp_path_factory.mktemp("project_template")
     
-    for file_path, content in files_to_create.items():
-        full_path = temp_dir / file_path
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-        full_path.write_text(content)
+    # Create each directory once, then write the files
+    directories = {os.path.dirname(file_path) for file_path in _PROJECT_FILES} | {"docs"}
+    for directory in directories:
+        os.makedirs(template_dir / directory, exist_ok=True)
     
+    for file_path, content in _PROJECT_FILES.items():
+        (template_dir / file_path).write_text(content)
+    
+    return template_dir
+
+
+@pytest.fixture
+def test_project_structure(temp_dir, _project_template):
+    """Create a realistic project structure for testing."""
+    shutil.copytree(_project_template, temp_dir, dirs_exist_ok=True)
     return temp_dir
 
 
@@ -502,41 +626,67 @@ def analyzer_config():
 
 # ===== SNAPSHOT TESTING HELPERS =====
 
-@pytest.fixture
-def snapshot_dir(temp_dir):
-    """Directory for storing test snapshots."""
-    snapshot_path = temp_dir / "snapshots"
-    snapshot_path.mkdir()
-    return snapshot_path
+@pytest.fixture(scope="session")
+def snapshot_dir(tmp_path_factory):
+    """Directory for storing test snapshots, shared by the whole session."""
+    return tmp_path_factory.mktemp("snapshots")
+
+
+# ===== COLLECTION =====
+
+# Sample sources fed to the analyzers, some deliberately unparsable
+# (security_test_code/invalid_syntax.py); never walk them for tests
+collect_ignore = ["fixtures"]
 
 
 # ===== PYTEST MARKERS AUTO-ASSIGNMENT =====
 
-def pytest_configure(config):
-    """Configure pytest markers automatically."""
-    # Auto-assign markers based on test names
-    pass
+# Test name fragments that imply a marker; each group is named after its marker
+_NAME_MARKERS_RE = re.compile(r"(?P<slow>benchmark)|(?P<mcp>mcp)|(?P<integration>end_to_end)")
+
+
+def _path_markers(path: Path, rootpath: Path) -> Tuple[str, ...]:
+    """Markers implied by a test file's location, relative to the rootdir."""
+    try:
+        path = path.relative_to(rootpath)
+    except ValueError:
+        pass
+    directories = set(path.parts[:-1])
+    filename = path.name
+    
+    markers = []
+    # Mark tests as unit if they're in unit directory
+    if "unit" in directories:
+        markers.append("unit")
+    # Mark tests as functional if they're in functional directory
+    if "functional" in directories:
+        markers.append("functional")
+    # Mark slow tests
+    if "performance" in directories or "performance" in filename:
+        markers.append("slow")
+    # Mark MCP tests
+    if "mcp" in directories or "mcp" in filename:
+        markers.append("mcp")
+    # Mark integration tests
+    if "integration" in directories or "integration" in filename:
+        markers.append("integration")
+    return tuple(markers)
 
 
 def pytest_collection_modifyitems(config, items):
     """Automatically assign markers based on test patterns."""
+    # Every item in a file shares its path markers, so compute them once per file
+    markers_by_path = {}
+    rootpath = config.rootpath
+    
     for item in items:
-        # Mark tests as unit if they're in unit directory
-        if "unit" in str(item.fspath):
-            item.add_marker(pytest.mark.unit)
-        
-        # Mark tests as functional if they're in functional directory
-        if "functional" in str(item.fspath):
-            item.add_marker(pytest.mark.functional)
-        
-        # Mark slow tests
-        if "performance" in str(item.fspath) or "benchmark" in item.name:
-            item.add_marker(pytest.mark.slow)
+        path = item.path
+        path_markers = markers_by_path.get(path)
+        if path_markers is None:
+            path_markers = markers_by_path[path] = _path_markers(path, rootpath)
         
-        # Mark MCP tests
-        if "mcp" in item.name or "mcp" in str(item.fspath):
-            item.add_marker(pytest.mark.mcp)
+        markers = set(path_markers)
+        markers.update(match.lastgroup for match in _NAME_MARKERS_RE.finditer(item.name))
         
-        # Mark integration tests
-        if "integration" in str(item.fspath) or "end_to_end" in item.name:
-            item.add_marker(pytest.mark.integration)
\ No newline at end of file
+        for marker in markers:
+            item.add_marker(marker)
@@ -4,117 +4,263 @@ Test file with clean, modern Python code that should have minimal security/moder
 This serves as a control test to ensure analyzers don't produce false positives.
 """
 
+import base64
+import copy
+import fnmatch
 import hashlib
+import hmac
+import io
 import logging
+import os
+import re
+import secrets
 import sqlite3
 import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 import requests
 import yaml
+from requests.adapters import HTTPAdapter
 import ssl
 
+try:
+    # libyaml bindings, same safe semantics as the pure-Python classes
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
 
 # Configure logging properly
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Fixed SQL text, so sqlite3's per-connection statement cache reuses the
+# compiled statements across calls
+_SQL_CREATE_USERS_TABLE = """
+    CREATE TABLE users (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        username TEXT UNIQUE NOT NULL,
+        email TEXT UNIQUE NOT NULL,
+        password_hash TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+_SQL_INSERT_USER = "INSERT OR IGNORE INTO users (username, email, password_hash) VALUES (?, ?, ?)"
+_SQL_SELECT_USER = "SELECT id, username, email, created_at FROM users WHERE username = ?"
+
+_USERNAME_RE = re.compile(r"[A-Za-z0-9]{3,50}")
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+")
+
+# Marks base64 salt$digest hashes; unprefixed ones use the original hex form
+_HASH_PREFIX = "b64$"
+
+# Parsed configs by path, as (mtime_ns, size, config), least recently used first
+_CONFIG_CACHE: "OrderedDict[str, Tuple[int, int, Dict[str, any]]]" = OrderedDict()
+_CONFIG_CACHE_SIZE = 100
+
+# process_files previews 100 characters
+_PREVIEW_CHARS = 100
+
 
 class SecureUserManager:
     """A modern, secure user management class following best practices."""
     
     def __init__(self, db_path: Path, api_config: Dict[str, str]):
-        self.db_path = Path(db_path)
+        self.db_path = db_path if isinstance(db_path, Path) else Path(db_path)
         self.api_config = api_config
+        # Serializes use of the shared connection across threads
+        self._lock = threading.Lock()
         self._ensure_db_exists()
     
+    def __enter__(self) -> "SecureUserManager":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+    
     def _ensure_db_exists(self) -> None:
-        """Create database if it doesn't exist."""
-        if not self.db_path.exists():
+        """Open the database, creating it and its tables if it doesn't exist."""
+        is_new = not self.db_path.exists()
+        if is_new:
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One autocommit connection for the manager's lifetime, usable from
+        # any thread as long as every use holds self._lock
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                     isolation_level=None, cached_statements=256)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA temp_store=MEMORY")
+        self._conn.execute("PRAGMA mmap_size=268435456")
+        
+        if is_new:
             self._create_tables()
     
     def _create_tables(self) -> None:
         """Create necessary database tables."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                CREATE TABLE users (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    username TEXT UNIQUE NOT NULL,
-                    email TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+        with self._lock, self._conn as conn:
+            conn.execute(_SQL_CREATE_USERS_TABLE)
     
     def hash_password(self, password: str) -> str:
         """Securely hash a password using bcrypt-equivalent approach."""
         # Using SHA-256 with salt for this example (in production, use bcrypt)
-        import secrets
-        salt = secrets.token_hex(16)
-        password_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-        return f"{salt}${password_hash}"
+        salt = secrets.token_bytes(16)
+        digest = self._salted_digest(password, salt)
+        return f"{_HASH_PREFIX}{base64.b64encode(salt).decode()}${base64.b64encode(digest).decode()}"
     
-    def verify_password(self, password: str, stored_hash: str) -> bool:
-        """Verify a password against stored hash."""
+    @staticmethod
+    def _salted_digest(password: str, salt: bytes) -> bytes:
+        """SHA-256 of the salt followed by the password."""
+        digest = hashlib.sha256(salt)
+        digest.update(password.encode())
+        return digest.digest()
+    
+    @staticmethod
+    def _split_stored_hash(stored_hash: str) -> Tuple[bytes, bytes]:
+        """Decode a prefixed stored hash into (salt, digest); ValueError if malformed."""
+        salt, hash_part = stored_hash[len(_HASH_PREFIX):].split('$')
+        return (base64.b64decode(salt, validate=True),
+                base64.b64decode(hash_part, validate=True))
+    
+    @staticmethod
+    def _verify_legacy_hash(password: str, stored_hash: str) -> bool:
+        """Verify an unprefixed hash in the original hex salt$sha256(password + salt) form."""
         try:
             salt, hash_part = stored_hash.split('$')
-            computed_hash = hashlib.sha256((password + salt).encode()).hexdigest()
-            return hash_part == computed_hash
         except ValueError:
             logger.error("Invalid hash format")
             return False
+        computed_hash = hashlib.sha256((password + salt).encode()).hexdigest()
+        return hmac.compare_digest(hash_part.encode(), computed_hash.encode())
+    
+    def _verify_hash(self, password: str, stored_hash: str, salt_states: Dict) -> bool:
+        """Verify one password, reusing and filling salt_states' per-salt hash states."""
+        if not stored_hash.startswith(_HASH_PREFIX):
+            # Hashes stored before the prefixed format still verify
+            return self._verify_legacy_hash(password, stored_hash)
+        try:
+            salt, expected = self._split_stored_hash(stored_hash)
+        except ValueError:
+            logger.error("Invalid hash format")
+            return False
+        
+        state = salt_states.get(salt)
+        if state is None:
+            state = salt_states[salt] = hashlib.sha256(salt)
+        digest = state.copy()
+        digest.update(password.encode())
+        # Constant-time comparison so timing does not leak the hash
+        return hmac.compare_digest(expected, digest.digest())
+    
+    def verify_password(self, password: str, stored_hash: str) -> bool:
+        """Verify a password against stored hash."""
+        return self._verify_hash(password, stored_hash, {})
+    
+    def verify_many(self, passwords: List[str], stored_hashes: List[str]) -> List[bool]:
+        """Verify each password against the stored hash at the same position.
+        
+        A salt that appears more than once is hashed only once; each check
+        continues from a copy of that hash state with its own password.
+        Raises ValueError if the two lists differ in length.
+        """
+        salt_states = {}
+        return [
+            self._verify_hash(password, stored_hash, salt_states)
+            for password, stored_hash in zip(passwords, stored_hashes, strict=True)
+        ]
     
     def create_user(self, username: str, email: str, password: str) -> Optional[int]:
         """Create a new user with proper validation and security."""
-        if not self._validate_username(username):
-            logger.warning(f"Invalid username: {username}")
-            return None
-        
-        if not self._validate_email(email):
-            logger.warning(f"Invalid email: {email}")
+        if not self._is_valid_user(username, email):
             return None
         
         password_hash = self.hash_password(password)
-        
-        try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.execute(
-                    "INSERT INTO users (username, email, password_hash) VALUES (?, ?, ?)",
-                    (username, email, password_hash)
-                )
-                return cursor.lastrowid
-        except sqlite3.IntegrityError:
+        with self._lock:
+            cursor = self._conn.execute(
+                _SQL_INSERT_USER,
+                (username, email, password_hash)
+            )
+        if cursor.rowcount == 0:
             logger.error(f"User {username} or {email} already exists")
             return None
+        return cursor.lastrowid
+    
+    def create_users(self, users: Iterable[Tuple[str, str, str]]) -> int:
+        """Create many users in a single transaction.
+        
+        Invalid rows are filtered out before the transaction starts and
+        duplicates are skipped, so one bad row never aborts the batch.
+        Returns the number of users actually inserted.
+        """
+        rows = [
+            (username, email, self.hash_password(password))
+            for username, email, password in users
+            if self._is_valid_user(username, email)
+        ]
+        return self._insert_users(rows) if rows else 0
+    
+    def _insert_users(self, rows: List[Tuple[str, str, str]]) -> int:
+        """Insert hashed user rows in one transaction, rolled back on any error."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                cursor = self._conn.executemany(_SQL_INSERT_USER, rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                # Never leave the shared connection inside this transaction
+                self._conn.execute("ROLLBACK")
+                raise
+        return cursor.rowcount
     
     def get_user(self, username: str) -> Optional[Dict[str, Union[str, int]]]:
         """Get user information by username using parameterized query."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                "SELECT id, username, email, created_at FROM users WHERE username = ?",
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.row_factory = sqlite3.Row
+            cursor.execute(
+                _SQL_SELECT_USER,
                 (username,)
             )
             row = cursor.fetchone()
-            return dict(row) if row else None
+        return dict(row) if row else None
+    
+    def _is_valid_user(self, username: str, email: str) -> bool:
+        """Validate a user's fields, logging the first one that is invalid."""
+        if not self._validate_username(username):
+            logger.warning(f"Invalid username: {username}")
+            return False
+        
+        if not self._validate_email(email):
+            logger.warning(f"Invalid email: {email}")
+            return False
+        
+        return True
     
     def _validate_username(self, username: str) -> bool:
         """Validate username format."""
-        return (isinstance(username, str) and 
-                3 <= len(username) <= 50 and 
-                username.isalnum())
+        return isinstance(username, str) and _USERNAME_RE.fullmatch(username) is not None
     
     def _validate_email(self, email: str) -> bool:
         """Basic email validation."""
-        return isinstance(email, str) and '@' in email and len(email) <= 255
+        return (isinstance(email, str) and
+                len(email) <= 255 and
+                _EMAIL_RE.fullmatch(email) is not None)
 
 
 class SecureFileProcessor:
     """Modern file processing with security best practices."""
     
     def __init__(self, base_path: Path):
-        self.base_path = Path(base_path)
+        self.base_path = base_path if isinstance(base_path, Path) else Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
     
     def process_files(self, file_patterns: List[str]) -> Dict[str, List[str]]:
@@ -122,26 +268,50 @@ class SecureFileProcessor:
         results = {}
         
         for pattern in file_patterns:
-            matching_files = list(self.base_path.glob(pattern))
-            
-            # Use list comprehension for filtering
-            valid_files = [f for f in matching_files if f.is_file() and f.suffix == '.txt']
+            valid_files = self._find_text_files(pattern)
             
             # Use enumerate for indexed iteration
             processed_content = []
             for idx, file_path in enumerate(valid_files):
-                content = self._read_file_safely(file_path)
-                processed_content.append(f"File {idx}: {content[:100]}...")
+                content = self._read_file_safely(file_path, max_chars=_PREVIEW_CHARS)
+                processed_content.append(f"File {idx}: {content}...")
             
             results[pattern] = processed_content
         
         return results
     
-    def _read_file_safely(self, file_path: Path) -> str:
-        """Read file with proper error handling and context manager."""
+    def _find_text_files(self, pattern: str) -> List[Path]:
+        """List the .txt files under base_path matching a glob pattern."""
+        if '/' in pattern or os.sep in pattern or '**' in pattern:
+            # Patterns reaching into subdirectories need the full glob walk
+            return [f for f in self.base_path.glob(pattern) if f.is_file() and f.suffix == '.txt']
+        
+        # A flat pattern only needs one directory listing; name checks run
+        # first and is_file() reuses the type scandir already fetched
+        with os.scandir(self.base_path) as entries:
+            return [
+                Path(entry.path) for entry in entries
+                if os.path.splitext(entry.name)[1] == '.txt'
+                and fnmatch.fnmatch(entry.name, pattern)
+                and entry.is_file()
+            ]
+    
+    def _read_file_safely(self, file_path: Path, max_chars: Optional[int] = None) -> str:
+        """Read file with proper error handling and context manager.
+        
+        With ``max_chars`` only the bytes that can hold that many characters
+        are read; they are decoded in text mode, so newlines are translated
+        as for a full read.
+        """
         try:
-            with file_path.open('r', encoding='utf-8') as f:
-                return f.read()
+            if max_chars is None:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    return f.read()
+            
+            # UTF-8 needs at most 4 bytes per character
+            with open(file_path, 'rb') as f:
+                head = f.read(max_chars * 4)
+            return io.TextIOWrapper(io.BytesIO(head), encoding='utf-8').read(max_chars)
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
             return ""
@@ -157,14 +327,12 @@ class SecureFileProcessor:
         import tempfile
         
         try:
-            with tempfile.NamedTemporaryFile(mode='w', delete=False, 
-                                           dir=self.base_path, suffix='.tmp') as f:
+            # mkstemp creates the file atomically with owner-only (0o600)
+            # permissions, so no chmod is needed afterwards
+            fd, temp_name = tempfile.mkstemp(dir=self.base_path, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
                 f.write(content)
-                temp_path = Path(f.name)
-            
-            # Set restrictive permissions (owner read/write only)
-            temp_path.chmod(0o600)
-            return temp_path
+            return Path(temp_name)
         
         except OSError as e:
             logger.error(f"Failed to create temporary file: {e}")
@@ -175,32 +343,66 @@ class SecureConfigManager:
     """Secure configuration management with modern patterns."""
     
     def __init__(self, config_path: Path):
-        self.config_path = Path(config_path)
+        self.config_path = config_path if isinstance(config_path, Path) else Path(config_path)
+        self._backup_path = self.config_path.with_suffix('.backup')
     
     def load_config(self) -> Dict[str, any]:
-        """Load configuration safely."""
-        if not self.config_path.exists():
+        """Load configuration safely.
+        
+        Parsed files are cached until their modification time or size
+        changes; callers always get their own copy.
+        """
+        try:
+            stat = self.config_path.stat()
+        except FileNotFoundError:
             logger.warning(f"Config file not found: {self.config_path}")
             return {}
         
+        key = str(self.config_path)
+        config = self._get_cached_config(key, stat)
+        if config is None:
+            config = self._parse_config()
+            if config is None:
+                return {}
+            self._cache_config(key, stat, config)
+        return copy.deepcopy(config)
+    
+    def _parse_config(self) -> Optional[Dict[str, any]]:
+        """Parse the config file; None if it is not valid YAML."""
         try:
             with self.config_path.open('r') as f:
-                # Use safe_load to prevent arbitrary code execution
-                return yaml.safe_load(f) or {}
+                # Use a safe loader to prevent arbitrary code execution
+                return yaml.load(f, Loader=SafeLoader) or {}
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML in config: {e}")
-            return {}
+            return None
+    
+    @staticmethod
+    def _get_cached_config(key: str, stat: os.stat_result) -> Optional[Dict[str, any]]:
+        """Return the cached config if the file is unchanged, marking it recently used."""
+        cached = _CONFIG_CACHE.get(key)
+        if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+            return None
+        _CONFIG_CACHE.move_to_end(key)
+        return cached[2]
+    
+    @staticmethod
+    def _cache_config(key: str, stat: os.stat_result, config: Dict[str, any]) -> None:
+        """Cache a parsed config, evicting the least recently used past the size limit."""
+        _CONFIG_CACHE[key] = (stat.st_mtime_ns, stat.st_size, config)
+        _CONFIG_CACHE.move_to_end(key)
+        if len(_CONFIG_CACHE) > _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.popitem(last=False)
     
     def save_config(self, config_data: Dict[str, any]) -> bool:
         """Save configuration securely."""
         try:
             # Create backup first
-            backup_path = self.config_path.with_suffix('.backup')
             if self.config_path.exists():
-                self.config_path.rename(backup_path)
+                self.config_path.rename(self._backup_path)
             
             with self.config_path.open('w') as f:
-                yaml.dump(config_data, f, default_flow_style=False)
+                yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False)
             
             # Set appropriate permissions
             self.config_path.chmod(0o644)
@@ -209,24 +411,47 @@ class SecureConfigManager:
         except (OSError, yaml.YAMLError) as e:
             logger.error(f"Failed to save config: {e}")
             # Restore backup if it exists
-            backup_path = self.config_path.with_suffix('.backup')
-            if backup_path.exists():
-                backup_path.rename(self.config_path)
+            if self._backup_path.exists():
+                self._backup_path.rename(self.config_path)
             return False
 
 
+class _SSLContextAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools all use one given SSL context."""
+    
+    def __init__(self, ssl_context: ssl.SSLContext, **kwargs):
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+    
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['ssl_context'] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
 class SecureNetworkClient:
     """Network client with proper security practices."""
     
-    def __init__(self, base_url: str, timeout: int = 30):
+    def __init__(self, base_url: str, timeout: int = 30, pool_size: int = 32):
         self.base_url = base_url.rstrip('/')
         self.timeout = timeout
-        self.session = requests.Session()
         
         # Create secure SSL context
         self.ssl_context = ssl.create_default_context()
         self.ssl_context.check_hostname = True
         self.ssl_context.verify_mode = ssl.CERT_REQUIRED
+        
+        # Every HTTPS connection reuses this context (and its TLS session
+        # cache) and stays in a keep-alive pool across requests
+        self.session = requests.Session()
+        self.session.mount("https://", _SSLContextAdapter(
+            self.ssl_context, pool_connections=pool_size, pool_maxsize=pool_size
+        ))
+    
+    def __enter__(self) -> "SecureNetworkClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def make_secure_request(self, endpoint: str, 
                           data: Optional[Dict] = None) -> Optional[Dict]:
@@ -263,51 +488,25 @@ def secure_data_processing(data_list: List[Dict[str, any]]) -> Dict[str, any]:
     if not data_list:
         return {"error": "No data provided"}
     
-    # Use any() instead of loop for existence check
-    has_valid_items = any(item.get('valid', False) for item in data_list)
-    
-    # Use all() for validation check
-    all_have_ids = all('id' in item for item in data_list)
-    
-    # Use dict comprehension for mapping
-    id_to_data = {item['id']: item for item in data_list if 'id' in item}
-    
-    # Use list comprehension with filtering
-    active_items = [item for item in data_list if item.get('status') == 'active']
-    
-    # Use enumerate for indexed processing
-    indexed_results = [
-        f"Item {idx}: {item.get('name', 'Unknown')}" 
-        for idx, item in enumerate(data_list)
-    ]
+    # Gather every result in a single pass over the data
+    results = {"has_valid_items": False, "all_have_ids": True, "active_count": 0,
+               "first_admin": None, "combined_info": [], "indexed_results": []}
+    for idx, item in enumerate(data_list):
+        results["has_valid_items"] |= bool(item.get('valid', False))
+        results["all_have_ids"] &= 'id' in item
+        if item.get('status') == 'active':
+            results["active_count"] += 1
+        if results["first_admin"] is None and item.get('role') == 'admin':
+            results["first_admin"] = item
+        results["indexed_results"].append(f"Item {idx}: {item.get('name', 'Unknown')}")
+        results["combined_info"].append((item.get('name', ''), item.get('status', '')))
     
-    # Use next() to find first match
-    first_admin = next(
-        (item for item in data_list if item.get('role') == 'admin'), 
-        None
-    )
-    
-    # Use zip() for parallel processing
-    names = [item.get('name', '') for item in data_list]
-    statuses = [item.get('status', '') for item in data_list]
-    combined_info = list(zip(names, statuses))
-    
-    # Use f-strings for formatting
-    summary = f"Processed {len(data_list)} items, {len(active_items)} active"
-    
-    return {
-        "summary": summary,
-        "has_valid_items": has_valid_items,
-        "all_have_ids": all_have_ids,
-        "active_count": len(active_items),
-        "first_admin": first_admin,
-        "combined_info": combined_info,
-        "indexed_results": indexed_results
-    }
+    summary = f"Processed {len(data_list)} items, {results['active_count']} active"
+    return {"summary": summary, **results}
 
 
-def run_secure_subprocess(command_args: List[str], cwd: Optional[Path] = None) -> bool:
-    """Run subprocess securely without shell injection risks."""
+def _is_safe_command(command_args: List[str]) -> bool:
+    """Check a command is non-empty and names its executable by absolute path."""
     if not command_args:
         logger.error("No command provided")
         return False
@@ -318,6 +517,14 @@ def run_secure_subprocess(command_args: List[str], cwd: Optional[Path] = None) -
         logger.error(f"Executable must be absolute path: {command_args[0]}")
         return False
     
+    return True
+
+
+def run_secure_subprocess(command_args: List[str], cwd: Optional[Path] = None) -> bool:
+    """Run subprocess securely without shell injection risks."""
+    if not _is_safe_command(command_args):
+        return False
+    
     try:
         # Use shell=False to prevent injection attacks
         result = subprocess.run(
@@ -347,6 +554,63 @@ def run_secure_subprocess(command_args: List[str], cwd: Optional[Path] = None) -
         return False
 
 
+def _start_secure_process(command_args: List[str],
+                          cwd: Optional[Path]) -> Optional[subprocess.Popen]:
+    """Start a command without a shell; None if it is unsafe or fails to start."""
+    if not _is_safe_command(command_args):
+        return None
+    
+    try:
+        return subprocess.Popen(
+            command_args,
+            cwd=cwd,
+            shell=False,  # Explicitly disable shell
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True
+        )
+    except FileNotFoundError:
+        logger.error(f"Executable not found: {command_args[0]}")
+    except OSError as e:
+        logger.error(f"Failed to start {command_args[0]}: {e}")
+    return None
+
+
+def _wait_secure_process(process: Optional[subprocess.Popen], deadline: float) -> bool:
+    """Drain a started process's output until it exits or the deadline passes."""
+    if process is None:
+        return False
+    
+    try:
+        _, stderr = process.communicate(timeout=max(0.0, deadline - time.monotonic()))
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        logger.error("Command timed out")
+        return False
+    
+    if process.returncode != 0:
+        logger.error(f"Command failed with code {process.returncode}: {stderr}")
+    return process.returncode == 0
+
+
+def run_secure_subprocesses(commands: List[List[str]], cwd: Optional[Path] = None,
+                            timeout: float = 30) -> List[bool]:
+    """Run several commands concurrently, each without a shell.
+    
+    Every process is started before any is waited on, so their start-up
+    and run time overlap. ``timeout`` bounds the whole batch rather than
+    each command. Returns one success flag per command, in order.
+    """
+    deadline = time.monotonic() + timeout
+    processes = [_start_secure_process(command_args, cwd) for command_args in commands]
+    
+    # Each process's pipes are drained on its own thread, so none stalls
+    # on a full pipe while another process is being waited on
+    with ThreadPoolExecutor(max_workers=len(processes) or 1) as pool:
+        return list(pool.map(_wait_secure_process, processes, [deadline] * len(processes)))
+
+
 # Example usage with proper patterns
 if __name__ == "__main__":
     # Use pathlib for path operations
@@ -8,102 +8,231 @@ These tests validate MCP protocol compliance and tool functionality.
 import pytest
 import json
 import asyncio
-from unittest.mock import Mock, AsyncMock, patch
+import importlib.util
+import time
+from collections import Counter
+from types import MappingProxyType
 from typing import Dict, Any, List
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
 
-
-@pytest.mark.mcp
-@pytest.mark.integration
-class TestMCPToolDiscovery:
-    """Test MCP tool discovery and registration."""
-
-    def test_mcp_tools_available(self):
-        """Test that required MCP tools are available."""
-        # These are the expected tools based on your MCP server
-        expected_tools = [
-            "analyze_python_code",
-            "extract_function", 
-            "quick_analyze"
+# Checked without importing, so environments lacking the MCP SDK skip at collection
+_HAS_MCP = importlib.util.find_spec("mcp") is not None
+
+# Synthetic modules for the resource tests, built once at import
+_TEN_FUNCS = "\n".join(f"def func_{i}(): pass" for i in range(10))
+_LARGE_CODE = "\n".join(f"def large_func_{j}(): pass" for j in range(50))
+
+# Tools the server is expected to register
+_EXPECTED_TOOLS = frozenset({"analyze_python_code", "extract_function", "quick_analyze"})
+
+
+@pytest.fixture(scope="module")
+def mcp_server():
+    """The MCP server module, imported once; skips when MCP is not usable."""
+    # An incompatible mcp release fails at import with AttributeError, which
+    # importorskip does not catch
+    try:
+        import mcp_refactoring_assistant.mcp_server as server_module
+    except (ImportError, AttributeError) as e:
+        pytest.skip(f"MCP server unavailable: {e}")
+    # The module still imports when mcp itself fails to load, but without
+    # the server handlers
+    if not server_module.MCP_AVAILABLE:
+        pytest.skip("MCP server unavailable: MCP_AVAILABLE is False")
+    return server_module
+
+
+@pytest.fixture(scope="module")
+def empty_code():
+    """An empty module, as sent when a client omits the content."""
+    return ""
+
+
+# Tool schemas as advertised to MCP clients, built once at import
+_ANALYZE_SCHEMA = {
+    "name": "analyze_python_code",
+    "description": "Analyze Python code for refactoring opportunities",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "Python code content to analyze"
+            },
+            "mode": {
+                "type": "string", 
+                "enum": ["guide_only", "apply_changes"],
+                "default": "guide_only"
+            },
+            "file_path": {
+                "type": "string",
+                "description": "Optional file path for context"
+            },
+            "line_threshold": {
+                "type": "integer",
+                "default": 20,
+                "description": "Minimum lines for long functions"
+            }
+        },
+        "required": ["content"]
+    }
+}
+
+_EXTRACT_SCHEMA = {
+    "name": "extract_function",
+    "description": "Extract specific functions with guide or apply mode",
+    "inputSchema": {
+        "type": "object", 
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "Python code content"
+            },
+            "mode": {
+                "type": "string",
+                "enum": ["guide_only", "apply_changes"],
+                "default": "guide_only"
+            },
+            "function_name": {
+                "type": "string",
+                "description": "Function to extract from"
+            }
+        },
+        "required": ["content"]
+    }
+}
+
+# Claude Desktop requires a descriptive description and a required content
+_CLAUDE_DESKTOP_SCHEMA = {
+    "name": "analyze_python_code",
+    "description": "Analyze Python code and provide refactoring guidance",
+    "inputSchema": {
+        "type": "object",
+        "properties": {
+            "content": {
+                "type": "string",
+                "description": "Python code to analyze"
+            }
+        },
+        "required": ["content"]
+    }
+}
+
+# Protocol messages and client responses; read-only so tests cannot alter them
+_MCP_REQUEST = MappingProxyType({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {
+        "name": "analyze_python_code",
+        "arguments": {
+            "content": "def test(): pass",
+            "mode": "guide_only"
+        }
+    }
+})
+
+_MCP_RESPONSE = MappingProxyType({
+    "jsonrpc": "2.0", 
+    "id": 1,
+    "result": {
+        "content": [
+            {
+                "type": "text",
+                "text": "Analysis complete"
+            }
         ]
-        
-        # In a real MCP integration test, you would check with the actual MCP server
-        # For now, we'll verify the tools exist conceptually
-        for tool_name in expected_tools:
-            # This would normally call the MCP server's list_tools
-            assert tool_name in expected_tools, f"Tool {tool_name} should be available"
-
-    def test_tool_schemas_valid(self):
-        """Test that MCP tool schemas are valid."""
-        # Verify analyze_python_code schema
-        analyze_schema = {
+    }
+})
+
+_MCP_ERROR_RESPONSE = MappingProxyType({
+    "jsonrpc": "2.0",
+    "id": 1,
+    "error": {
+        "code": -32602,
+        "message": "Invalid params",
+        "data": {
+            "details": "Content parameter is required"
+        }
+    }
+})
+
+_GENERIC_RESPONSE = MappingProxyType({
+    "content": [
+        {
+            "type": "text",
+            "text": "Analysis results"
+        }
+    ],
+    "isError": False
+})
+
+_STREAMING_RESPONSE = MappingProxyType({
+    "content": [
+        {"type": "text", "text": "Starting analysis..."},
+        {"type": "text", "text": "Analyzing functions..."},
+        {"type": "text", "text": "Analysis complete."}
+    ]
+})
+
+# Shape of a tools/list result
+_TOOLS_LIST = {
+    "tools": [
+        {
             "name": "analyze_python_code",
             "description": "Analyze Python code for refactoring opportunities",
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "Python code content to analyze"
-                    },
-                    "mode": {
-                        "type": "string", 
-                        "enum": ["guide_only", "apply_changes"],
-                        "default": "guide_only"
-                    },
-                    "file_path": {
-                        "type": "string",
-                        "description": "Optional file path for context"
-                    },
-                    "line_threshold": {
-                        "type": "integer",
-                        "default": 20,
-                        "description": "Minimum lines for long functions"
-                    }
+                    "content": {"type": "string"},
+                    "mode": {"type": "string", "enum": ["guide_only", "apply_changes"]}
                 },
                 "required": ["content"]
             }
-        }
-        
-        # Verify schema structure
-        assert "name" in analyze_schema
-        assert "inputSchema" in analyze_schema
-        assert "properties" in analyze_schema["inputSchema"]
-        assert "content" in analyze_schema["inputSchema"]["properties"]
-
-    def test_extract_function_schema(self):
-        """Test extract_function tool schema."""
-        extract_schema = {
-            "name": "extract_function",
-            "description": "Extract specific functions with guide or apply mode",
+        },
+        {
+            "name": "extract_function", 
+            "description": "Extract functions with guidance",
             "inputSchema": {
-                "type": "object", 
+                "type": "object",
                 "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "Python code content"
-                    },
-                    "mode": {
-                        "type": "string",
-                        "enum": ["guide_only", "apply_changes"],
-                        "default": "guide_only"
-                    },
-                    "function_name": {
-                        "type": "string",
-                        "description": "Function to extract from"
-                    }
+                    "content": {"type": "string"},
+                    "function_name": {"type": "string"}
                 },
                 "required": ["content"]
             }
         }
+    ]
+}
+
+
+@pytest.mark.mcp
+@pytest.mark.integration
+@pytest.mark.skipif(not _HAS_MCP, reason="MCP not available")
+class TestMCPToolDiscovery:
+    """Test MCP tool discovery and registration."""
+
+    def test_mcp_tools_available(self, mcp_server):
+        """Test that the server lists exactly the required MCP tools."""
+        tools = asyncio.run(mcp_server.handle_list_tools())
+        assert {tool.name for tool in tools} == _EXPECTED_TOOLS
+
+    @pytest.mark.parametrize("schema", [
+        _ANALYZE_SCHEMA,
+        _EXTRACT_SCHEMA,
+        _CLAUDE_DESKTOP_SCHEMA,
+        *_TOOLS_LIST["tools"],
+    ], ids=["analyze", "extract", "claude_desktop", "list_analyze", "list_extract"])
+    def test_tool_schema_shape(self, schema):
+        """Test that MCP tool schemas are valid and client compatible."""
+        assert schema["name"] in _EXPECTED_TOOLS
+        assert len(schema["description"]) > 10, "Description should be descriptive"
         
-        assert extract_schema["name"] == "extract_function"
-        assert "content" in extract_schema["inputSchema"]["properties"]
+        input_schema = schema["inputSchema"]
+        assert input_schema["type"] == "object"
+        assert "content" in input_schema["properties"]
+        assert "content" in input_schema["required"]
 
 
 @pytest.mark.mcp
@@ -111,134 +240,65 @@ class TestMCPToolDiscovery:
 class TestMCPToolExecution:
     """Test MCP tool execution with various inputs."""
 
-    def test_analyze_python_code_tool(self, analyzer, simple_function_code):
-        """Test the analyze_python_code MCP tool functionality."""
-        # Simulate MCP tool call
-        tool_input = {
-            "content": simple_function_code,
-            "mode": "guide_only",
-            "file_path": "test.py",
-            "line_threshold": 20
-        }
-        
+    @pytest.mark.parametrize("file_path, source_fixture", [
+        ("test.py", "simple_function_code"),
+        ("complex.py", "complex_function_code"),
+        ("broken.py", "syntax_error_code"),
+    ], ids=["simple", "complex", "syntax_error"])
+    def test_analyze_tool_variants(self, analyzer, request, file_path, source_fixture):
+        """Test analyze_python_code tool calls and their MCP output format."""
         # This would normally go through the MCP protocol
-        result = analyzer.analyze_file(
-            tool_input.get("file_path", "test.py"),
-            tool_input["content"]
-        )
+        result = analyzer.analyze_file(file_path, request.getfixturevalue(source_fixture))
         
-        # Verify result format matches MCP expectations
+        # Should handle every input gracefully, returning guidance rather
+        # than modified code (syntax errors come back as guidance too)
         assert isinstance(result, list)
+        for guidance in result:
+            assert hasattr(guidance, 'issue_type')
+            assert hasattr(guidance, 'precise_steps')
         
-        # Convert to MCP response format
-        mcp_response = {
+        # Convert to MCP-compatible output format
+        severities = Counter(guidance.severity for guidance in result)
+        mcp_output = {
             "content": [
                 {
-                    "type": "text",
-                    "text": f"Analysis complete. Found {len(result)} refactoring opportunities."
+                    "type": "application/json",
+                    "data": {
+                        "analysis_results": [guidance.to_dict() for guidance in result],
+                        "summary": {
+                            "total_issues": len(result),
+                            **{f"{severity}_issues": severities[severity]
+                               for severity in ("critical", "high", "medium", "low")}
+                        }
+                    }
                 }
             ],
             "isError": False
         }
         
-        assert mcp_response["isError"] is False
-        assert len(mcp_response["content"]) > 0
+        # Verify output structure
+        assert mcp_output["isError"] is False
+        assert mcp_output["content"][0]["type"] == "application/json"
+        assert mcp_output["content"][0]["data"]["summary"]["total_issues"] == len(result)
 
-    def test_analyze_with_mode_guide_only(self, analyzer, complex_function_code):
-        """Test analyze_python_code in guide_only mode."""
-        tool_input = {
-            "content": complex_function_code,
-            "mode": "guide_only"
-        }
-        
-        result = analyzer.analyze_file("complex.py", tool_input["content"])
-        
-        # In guide_only mode, should return guidance, not modified code
-        assert isinstance(result, list)
-        if result:
-            for guidance in result:
-                # Should have guidance structure, not code modifications
-                assert hasattr(guidance, 'issue_type')
-                assert hasattr(guidance, 'precise_steps')
+    def test_tool_parameter_validation(self, analyzer, empty_code):
+        """Test that empty content is accepted and yields no guidance."""
+        assert analyzer.analyze_file("empty.py", empty_code) == []
 
-    def test_quick_analyze_tool(self):
+    def test_quick_analyze_tool(self, analyzer, mcp_server):
         """Test the quick_analyze MCP tool functionality."""
         # This test would normally go through the MCP protocol
         # For unit testing, we'll verify the tool is properly defined
-        from mcp_refactoring_assistant import mcp_server
-        
         # The tool should be available in the tool list
         # In real MCP integration, this would be called via protocol
         assert hasattr(mcp_server, 'handle_list_tools'), "MCP server should have tool listing capability"
         
         # Verify basic functionality by testing with analyzer directly
-        from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
-        analyzer = EnhancedRefactoringAnalyzer()
         result = analyzer.analyze_file("quick.py", "def simple(): return True")
         
         # Should return basic analysis info
         assert isinstance(result, list)
 
-    def test_tool_error_handling(self, analyzer):
-        """Test MCP tool error handling."""
-        # Test with invalid Python code
-        tool_input = {
-            "content": "def broken_function(\n    return 'invalid'",
-            "mode": "guide_only"
-        }
-        
-        result = analyzer.analyze_file("broken.py", tool_input["content"])
-        
-        # Should handle errors gracefully
-        assert isinstance(result, list)
-        # May contain syntax error guidance
-
-    def test_tool_parameter_validation(self, analyzer):
-        """Test MCP tool parameter validation."""
-        # Test missing required parameters
-        try:
-            # This would normally be validated by the MCP framework
-            tool_input = {
-                "mode": "guide_only"  # Missing required 'content'
-            }
-            
-            # Should handle missing content gracefully
-            result = analyzer.analyze_file("empty.py", "")
-            assert isinstance(result, list)
-            
-        except Exception as e:
-            # Or raise appropriate error
-            assert "content" in str(e).lower()
-
-    def test_tool_output_format(self, analyzer, simple_function_code):
-        """Test that MCP tool outputs are properly formatted."""
-        result = analyzer.analyze_file("format_test.py", simple_function_code)
-        
-        # Convert to MCP-compatible output format
-        mcp_output = {
-            "content": [
-                {
-                    "type": "application/json",
-                    "data": {
-                        "analysis_results": [guidance.to_dict() for guidance in result],
-                        "summary": {
-                            "total_issues": len(result),
-                            "critical_issues": len([g for g in result if g.severity == "critical"]),
-                            "high_issues": len([g for g in result if g.severity == "high"]),
-                            "medium_issues": len([g for g in result if g.severity == "medium"]),
-                            "low_issues": len([g for g in result if g.severity == "low"])
-                        }
-                    }
-                }
-            ]
-        }
-        
-        # Verify output structure
-        assert "content" in mcp_output
-        assert len(mcp_output["content"]) > 0
-        assert mcp_output["content"][0]["type"] == "application/json"
-        assert "data" in mcp_output["content"][0]
-
 
 @pytest.mark.mcp
 @pytest.mark.integration
@@ -247,101 +307,22 @@ class TestMCPProtocolCompliance:
 
     def test_mcp_request_response_format(self):
         """Test MCP request/response format compliance."""
-        # Example MCP request format
-        mcp_request = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "method": "tools/call",
-            "params": {
-                "name": "analyze_python_code",
-                "arguments": {
-                    "content": "def test(): pass",
-                    "mode": "guide_only"
-                }
-            }
-        }
-        
         # Verify request format
-        assert mcp_request["jsonrpc"] == "2.0"
-        assert "id" in mcp_request
-        assert mcp_request["method"] == "tools/call"
-        assert "params" in mcp_request
-
-        # Expected response format
-        mcp_response = {
-            "jsonrpc": "2.0", 
-            "id": 1,
-            "result": {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": "Analysis complete"
-                    }
-                ]
-            }
-        }
-        
-        assert mcp_response["jsonrpc"] == "2.0"
-        assert mcp_response["id"] == mcp_request["id"]
+        assert _MCP_REQUEST["jsonrpc"] == "2.0"
+        assert "id" in _MCP_REQUEST
+        assert _MCP_REQUEST["method"] == "tools/call"
+        assert "params" in _MCP_REQUEST
+
+        # Verify the response answers that request
+        assert _MCP_RESPONSE["jsonrpc"] == "2.0"
+        assert _MCP_RESPONSE["id"] == _MCP_REQUEST["id"]
 
     def test_mcp_error_response_format(self):
         """Test MCP error response format compliance."""
-        mcp_error_response = {
-            "jsonrpc": "2.0",
-            "id": 1,
-            "error": {
-                "code": -32602,
-                "message": "Invalid params",
-                "data": {
-                    "details": "Content parameter is required"
-                }
-            }
-        }
-        
         # Verify error response structure
-        assert "error" in mcp_error_response
-        assert "code" in mcp_error_response["error"]
-        assert "message" in mcp_error_response["error"]
-
-    def test_mcp_tool_list_format(self):
-        """Test MCP tool list format compliance."""
-        tools_list = {
-            "tools": [
-                {
-                    "name": "analyze_python_code",
-                    "description": "Analyze Python code for refactoring opportunities",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "content": {"type": "string"},
-                            "mode": {"type": "string", "enum": ["guide_only", "apply_changes"]}
-                        },
-                        "required": ["content"]
-                    }
-                },
-                {
-                    "name": "extract_function", 
-                    "description": "Extract functions with guidance",
-                    "inputSchema": {
-                        "type": "object",
-                        "properties": {
-                            "content": {"type": "string"},
-                            "function_name": {"type": "string"}
-                        },
-                        "required": ["content"]
-                    }
-                }
-            ]
-        }
-        
-        # Verify tools list structure
-        assert "tools" in tools_list
-        assert len(tools_list["tools"]) > 0
-        
-        for tool in tools_list["tools"]:
-            assert "name" in tool
-            assert "description" in tool
-            assert "inputSchema" in tool
+        assert "error" in _MCP_ERROR_RESPONSE
+        assert "code" in _MCP_ERROR_RESPONSE["error"]
+        assert "message" in _MCP_ERROR_RESPONSE["error"]
 
 
 @pytest.mark.mcp
@@ -349,62 +330,40 @@ class TestMCPProtocolCompliance:
 class TestMCPServerIntegration:
     """Test integration with MCP server."""
 
-    @patch('mcp_refactoring_assistant.mcp_server.EnhancedRefactoringAnalyzer')
-    def test_server_initialization(self, mock_analyzer):
+    def test_server_initialization(self, mcp_server, mock_analyzer, monkeypatch):
         """Test MCP server initialization."""
-        # Mock analyzer initialization
-        mock_analyzer.return_value = Mock()
+        # Stub analyzer initialization
+        monkeypatch.setattr(mcp_server, "EnhancedRefactoringAnalyzer",
+                            lambda *args, **kwargs: mock_analyzer)
         
         # This would test actual server startup
         # For now, verify mocking works
-        from mcp_refactoring_assistant import mcp_server
-        
         # Server should have tools registered
         # This would normally check server.list_tools()
         assert hasattr(mcp_server, 'handle_list_tools')
 
-    def test_server_tool_registration(self):
+    def test_server_tool_registration(self, mcp_server):
         """Test that all tools are properly registered with MCP server."""
-        expected_tools = ["analyze_python_code", "extract_function", "quick_analyze"]
-        
         # In actual test, would query the MCP server
         # For now, verify tools exist in module structure
-        from mcp_refactoring_assistant import mcp_server
-        
         # Verify the server has the handle_list_tools function which contains the tools
         assert hasattr(mcp_server, 'handle_list_tools'), "Server should have tool listing capability"
         assert hasattr(mcp_server, 'handle_call_tool'), "Server should have tool execution capability"
 
-    def test_server_handles_concurrent_requests(self, analyzer):
+    def test_server_handles_concurrent_requests(self, analyzer, thread_pool):
         """Test server handling of concurrent MCP requests."""
-        import threading
-        import time
-        
-        results = []
-        
-        def make_request(request_id):
-            # Simulate MCP tool call
-            result = analyzer.analyze_file(f"concurrent_{request_id}.py", "def test(): pass")
-            results.append((request_id, len(result)))
-        
-        # Create concurrent requests
-        threads = []
-        for i in range(5):
-            thread = threading.Thread(target=make_request, args=(i,))
-            threads.append(thread)
-            thread.start()
-        
-        # Wait for all requests to complete
-        for thread in threads:
-            thread.join()
+        # Simulate concurrent MCP tool calls on the shared pool
+        results = list(thread_pool.map(
+            lambda request_id: analyzer.analyze_file(f"concurrent_{request_id}.py", "def test(): pass"),
+            range(5)
+        ))
         
         # All requests should complete
         assert len(results) == 5
         
         # Results should be consistent
-        for request_id, result_count in results:
-            assert isinstance(result_count, int)
-            assert result_count >= 0
+        for result in results:
+            assert isinstance(result, list)
 
 
 @pytest.mark.mcp
@@ -412,65 +371,25 @@ class TestMCPServerIntegration:
 class TestMCPClientCompatibility:
     """Test compatibility with different MCP clients."""
 
-    def test_claude_desktop_compatibility(self):
-        """Test compatibility with Claude Desktop MCP client."""
-        # Claude Desktop specific requirements
-        tool_definition = {
-            "name": "analyze_python_code",
-            "description": "Analyze Python code and provide refactoring guidance",
-            "inputSchema": {
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "Python code to analyze"
-                    }
-                },
-                "required": ["content"]
-            }
-        }
-        
-        # Verify Claude Desktop compatibility requirements
-        assert len(tool_definition["description"]) > 10, "Description should be descriptive"
-        assert "content" in tool_definition["inputSchema"]["required"]
-
     def test_generic_mcp_client_compatibility(self):
         """Test compatibility with generic MCP clients."""
-        # Generic MCP client compatibility
-        response_format = {
-            "content": [
-                {
-                    "type": "text",
-                    "text": "Analysis results"
-                }
-            ],
-            "isError": False
-        }
-        
         # Should work with any MCP client
-        assert "content" in response_format
-        assert isinstance(response_format["content"], list)
-        assert response_format["isError"] is False
+        assert "content" in _GENERIC_RESPONSE
+        assert isinstance(_GENERIC_RESPONSE["content"], list)
+        assert _GENERIC_RESPONSE["isError"] is False
 
     def test_streaming_response_support(self):
         """Test support for streaming responses if needed."""
         # Some MCP clients may support streaming
-        streaming_response = {
-            "content": [
-                {"type": "text", "text": "Starting analysis..."},
-                {"type": "text", "text": "Analyzing functions..."},
-                {"type": "text", "text": "Analysis complete."}
-            ]
-        }
-        
-        assert len(streaming_response["content"]) > 1
-        for chunk in streaming_response["content"]:
+        assert len(_STREAMING_RESPONSE["content"]) > 1
+        for chunk in _STREAMING_RESPONSE["content"]:
             assert chunk["type"] == "text"
             assert "text" in chunk
 
 
 @pytest.mark.mcp
 @pytest.mark.integration
+@pytest.mark.xdist_group(name="resource")
 class TestMCPResourceManagement:
     """Test MCP resource management."""
 
@@ -485,33 +404,25 @@ class TestMCPResourceManagement:
         # In a real test, you'd check memory usage, file handles, etc.
         assert True  # Placeholder assertion
 
-    def test_timeout_handling(self, analyzer, performance_timer):
+    def test_timeout_handling(self, analyzer):
         """Test handling of long-running operations."""
-        # Create a potentially long-running analysis
-        large_code = "\n".join([f"def func_{i}(): pass" for i in range(100)])
-        
-        with performance_timer() as timer:
-            result = analyzer.analyze_file("timeout_test.py", large_code)
+        # A small module is enough to exercise the full analysis path; bulk
+        # input is covered by test_memory_management
+        start_ns = time.perf_counter_ns()
+        result = analyzer.analyze_file("timeout_test.py", _TEN_FUNCS)
+        elapsed_ns = time.perf_counter_ns() - start_ns
         
         # Should complete within reasonable time
-        assert timer.elapsed < 30.0, "Analysis should not take too long"
+        assert elapsed_ns < 30 * 1_000_000_000, "Analysis should not take too long"
         assert isinstance(result, list)
 
     def test_memory_management(self, analyzer):
         """Test memory management during analysis."""
-        import gc
-        
-        # Force garbage collection before test
-        gc.collect()
-        
-        # Perform memory-intensive operations
-        for i in range(20):
-            large_code = "\n".join([f"def large_func_{j}(): pass" for j in range(50)])
-            result = analyzer.analyze_file(f"memory_test_{i}.py", large_code)
-            
-            # Occasional cleanup
-            if i % 5 == 0:
-                gc.collect()
+        # Perform memory-intensive operations as one batch
+        results = analyzer.analyze_files(
+            [(f"memory_test_{i}.py", _LARGE_CODE) for i in range(20)]
+        )
+        assert len(results) == 20
         
         # Memory should be manageable
         # In production, you'd monitor actual memory usage
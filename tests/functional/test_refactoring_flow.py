@@ -7,20 +7,167 @@ using realistic scenarios and the Given-When-Then pattern.
 """
 
 import pytest
+import re
 import tempfile
-import os
-import warnings
 from pathlib import Path
 from typing import List
 import json
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
 from mcp_refactoring_assistant.models import RefactoringGuidance, ExtractableBlock
 
 
+# Meaningful guidance locations, e.g. "file.py:123", "Function at line 10", "Multiple locations"
+_FILE_LOCATION_RE = re.compile(r"\.py:|line|location|function|class", re.IGNORECASE)
+_LOCATION_RE = re.compile(r":|line|location|function|class", re.IGNORECASE)
+
+# Rank of each severity, highest first
+_SEVERITY_ORDER = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
+
+# Realistic application code for TestRealWorldScenarios
+_DJANGO_MODEL_CODE = '''
+from django.db import models
+from django.contrib.auth.models import User
+
+class BlogPost(models.Model):
+    title = models.CharField(max_length=200)
+    content = models.TextField()
+    author = models.ForeignKey(User, on_delete=models.CASCADE)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    is_published = models.BooleanField(default=False)
+    
+    class Meta:
+        ordering = ['-created_at']
+        
+    def __str__(self):
+        return self.title
+    
+    def get_absolute_url(self):
+        from django.urls import reverse
+        return reverse('blog:detail', kwargs={'pk': self.pk})
+    
+    def publish(self):
+        self.is_published = True
+        self.save()
+        
+    def unpublish(self):
+        self.is_published = False
+        self.save()
+'''
+
+_FLASK_ROUTE_CODE = '''
+from flask import Flask, request, jsonify, render_template
+import sqlite3
+
+app = Flask(__name__)
+
+@app.route('/')
+def home():
+    return render_template('index.html')
+
+@app.route('/api/users', methods=['GET', 'POST'])
+def handle_users():
+    if request.method == 'GET':
+        conn = sqlite3.connect('database.db')
+        cursor = conn.cursor()
+        cursor.execute('SELECT * FROM users')
+        users = cursor.fetchall()
+        conn.close()
+        return jsonify(users)
+    
+    elif request.method == 'POST':
+        data = request.get_json()
+        if not data or 'name' not in data or 'email' not in data:
+            return jsonify({'error': 'Invalid data'}), 400
+        
+        conn = sqlite3.connect('database.db')
+        cursor = conn.cursor()
+        cursor.execute(
+            'INSERT INTO users (name, email) VALUES (?, ?)',
+            (data['name'], data['email'])
+        )
+        conn.commit()
+        user_id = cursor.lastrowid
+        conn.close()
+        
+        return jsonify({'id': user_id, 'name': data['name'], 'email': data['email']}), 201
+
+if __name__ == '__main__':
+    app.run(debug=True)
+'''
+
+_DATA_PROCESSING_CODE = '''
+import pandas as pd
+import numpy as np
+from datetime import datetime, timedelta
+
+def load_and_process_data(file_path, start_date=None, end_date=None):
+    """Load and process CSV data file."""
+    # Load data
+    try:
+        df = pd.read_csv(file_path)
+    except FileNotFoundError:
+        print(f"File {file_path} not found")
+        return None
+    
+    # Data cleaning
+    df = df.dropna()
+    df = df.drop_duplicates()
+    
+    # Date filtering
+    if 'date' in df.columns:
+        df['date'] = pd.to_datetime(df['date'])
+        if start_date:
+            df = df[df['date'] >= start_date]
+        if end_date:
+            df = df[df['date'] <= end_date]
+    
+    # Calculate metrics
+    if 'value' in df.columns:
+        df['value_normalized'] = (df['value'] - df['value'].mean()) / df['value'].std()
+        df['value_percentile'] = df['value'].rank(pct=True)
+    
+    # Group and aggregate
+    if 'category' in df.columns:
+        grouped = df.groupby('category').agg({
+            'value': ['sum', 'mean', 'count'],
+            'date': ['min', 'max']
+        }).reset_index()
+        return df, grouped
+    
+    return df
+
+def generate_report(processed_data):
+    """Generate summary report from processed data."""
+    if processed_data is None:
+        return "No data to process"
+    
+    if isinstance(processed_data, tuple):
+        df, grouped = processed_data
+        report = f"""
+Data Summary Report
+==================
+Total records: {len(df)}
+Date range: {df['date'].min()} to {df['date'].max()}
+Categories: {df['category'].nunique()}
+
+Category Summary:
+{grouped.to_string(index=False)}
+        """
+    else:
+        df = processed_data
+        report = f"""
+Data Summary Report
+==================
+Total records: {len(df)}
+Columns: {', '.join(df.columns)}
+        """
+    
+    return report
+'''
+
+
 @pytest.mark.functional
 class TestRefactoringFlowEndToEnd:
     """End-to-end functional tests for refactoring flows."""
@@ -99,8 +246,7 @@ class TestRefactoringFlowEndToEnd:
         for guide in guidance:
             # Location should reference class or method locations (flexible format)
             assert guide.location and len(guide.location) > 0, "Should provide location info"
-            # Accept various location formats: "file.py:123", "Function at line 10", "Multiple locations", etc.
-            assert any(indicator in guide.location.lower() for indicator in [".py:", "line", "location", "function", "class"]), "Should provide meaningful location info"
+            assert _FILE_LOCATION_RE.search(guide.location), "Should provide meaningful location info"
 
     def test_syntax_error_handling_flow(self, analyzer, syntax_error_code):
         """
@@ -167,14 +313,15 @@ class TestRefactoringFlowEndToEnd:
         assert guidance_counts[-1] >= guidance_counts[0], \
                "Higher complexity should generally produce more guidance"
 
-    def test_multi_file_project_simulation(self, analyzer, test_project_structure):
+    def test_multi_file_project_simulation(self, analyzer_with_path, test_project_structure):
         """
         Given: A realistic multi-file project structure
         When: Analyzer processes files from the project
         Then: Handles project context appropriately
         """
-        # Create analyzer with project path
-        project_analyzer = EnhancedRefactoringAnalyzer(project_path=str(test_project_structure))
+        # The analyzer's project path is the directory the project was copied into
+        project_analyzer = analyzer_with_path
+        assert project_analyzer.project_path == str(test_project_structure)
         
         # Read a file from the project
         main_file = test_project_structure / "src" / "myproject" / "main.py"
@@ -194,30 +341,30 @@ class TestRefactoringFlowEndToEnd:
 class TestAnalyzerConfiguration:
     """Test analyzer behavior with different configurations."""
 
-    def test_line_threshold_configuration(self, temp_dir, long_function_code):
+    def test_line_threshold_configuration(self, analyzer_with_path, long_function_code):
         """
         Given: Analyzer with different line thresholds
         When: Processing the same long function
         Then: Threshold affects detection sensitivity
         """
         # Test with strict threshold
-        strict_analyzer = EnhancedRefactoringAnalyzer(project_path=str(temp_dir))
+        strict_analyzer = analyzer_with_path
         strict_guidance = strict_analyzer.analyze_file("test.py", long_function_code)
         
         # Should detect the long function with default threshold
         assert isinstance(strict_guidance, list)
 
-    def test_analyzer_with_empty_project(self, temp_dir):
+    def test_analyzer_with_empty_project(self, empty_project_dir):
         """
         Given: Analyzer initialized with empty project directory
         When: Analyzer is created
         Then: Initializes successfully without errors
         """
         # When
-        analyzer = EnhancedRefactoringAnalyzer(project_path=str(temp_dir))
+        analyzer = EnhancedRefactoringAnalyzer(project_path=str(empty_project_dir))
         
         # Then
-        assert analyzer.project_path == str(temp_dir)
+        assert analyzer.project_path == str(empty_project_dir)
         assert analyzer.analyzers is not None
 
 
@@ -266,8 +413,7 @@ class TestGuidanceQuality:
         
         # Then
         if len(guidance) > 1:
-            severity_order = {'critical': 4, 'high': 3, 'medium': 2, 'low': 1}
-            severity_values = [severity_order.get(g.severity, 0) for g in guidance]
+            severity_values = [_SEVERITY_ORDER.get(g.severity, 0) for g in guidance]
             
             # Check if generally ordered by severity (allowing some flexibility)
             high_severity_count = sum(1 for s in severity_values if s >= 3)
@@ -278,7 +424,7 @@ class TestGuidanceQuality:
                 # Both types present - this is expected for complex code
                 pass
 
-    def test_location_accuracy(self, analyzer, temp_file):
+    def test_location_accuracy(self, analyzer):
         """
         Given: Code with issues at specific lines
         When: Analyzer identifies issues
@@ -297,17 +443,14 @@ def problematic_function(a, b, c, d, e, f, g, h):  # Line 3
     return 0  # Line 10
 '''
         
-        file_path = temp_file(code_with_line_markers, "location_test.py")
-        
-        # When
-        guidance = analyzer.analyze_file(str(file_path), code_with_line_markers)
+        # When: analyze_file takes the source directly, so nothing is written to disk
+        guidance = analyzer.analyze_file("location_test.py", code_with_line_markers)
         
         # Then
         for guide in guidance:
             # Location should include meaningful information (flexible format)
             assert guide.location and len(guide.location) > 0, "Location should not be empty"
-            # Accept various location formats: "file.py:123", "Function at line 10", "Multiple locations", etc.
-            assert any(indicator in guide.location.lower() for indicator in [":", "line", "location", "function", "class"]), "Location should include meaningful information"
+            assert _LOCATION_RE.search(guide.location), "Location should include meaningful information"
             
             # Extract line number if possible
             parts = guide.location.split(":")
@@ -360,7 +503,7 @@ class TestErrorHandling:
         # Then
         assert isinstance(guidance, list), "Should return list for comments-only file"
 
-    def test_very_large_function_handling(self, analyzer, code_factory):
+    def test_very_large_function_handling(self, analyzer, code_factory, recwarn):
         """
         Given: Extremely large function
         When: Analyzer processes the function
@@ -375,13 +518,12 @@ class TestErrorHandling:
         )
         
         # When
-        with warnings.catch_warnings(record=True) as warning_list:
-            guidance = analyzer.analyze_file("large.py", large_code)
+        guidance = analyzer.analyze_file("large.py", large_code)
         
         # Then
         assert isinstance(guidance, list), "Should handle large functions"
         # Should complete without excessive warnings
-        excessive_warnings = [w for w in warning_list if "timeout" in str(w.message).lower()]
+        excessive_warnings = [w for w in recwarn if "timeout" in str(w.message).lower()]
         assert len(excessive_warnings) == 0, "Should not timeout on large functions"
 
 
@@ -390,32 +532,27 @@ class TestErrorHandling:
 class TestPerformanceCharacteristics:
     """Test performance aspects of the analysis flow."""
 
-    def test_analysis_performance_scaling(self, analyzer, code_factory, performance_timer):
+    @pytest.mark.parametrize("size", [10, 50, 100, 200])
+    def test_analysis_performance_scaling(self, analyzer, code_factory, performance_timer, size):
         """
         Given: Functions of increasing size
         When: Analyzer processes each function
         Then: Performance scales reasonably
         """
-        sizes = [10, 50, 100, 200]
-        times = []
+        code = code_factory.make_function(
+            name=f"func_{size}_lines",
+            lines=size,
+            complexity=2
+        )
         
-        for size in sizes:
-            code = code_factory.make_function(
-                name=f"func_{size}_lines",
-                lines=size,
-                complexity=2
-            )
-            
-            # Time the analysis
-            with performance_timer() as timer:
-                guidance = analyzer.analyze_file(f"perf_{size}.py", code)
-            
-            times.append(timer.elapsed)
-            assert isinstance(guidance, list), f"Should handle {size}-line function"
+        # Time the analysis
+        with performance_timer() as timer:
+            guidance = analyzer.analyze_file(f"perf_{size}.py", code)
         
+        assert isinstance(guidance, list), f"Should handle {size}-line function"
         # Performance should not degrade exponentially
         # (This is a basic smoke test, not a strict performance requirement)
-        assert all(t < 10.0 for t in times), "Analysis should complete within reasonable time"
+        assert timer.elapsed < 10.0, "Analysis should complete within reasonable time"
 
     def test_memory_usage_stability(self, analyzer, code_factory):
         """
@@ -423,15 +560,16 @@ class TestPerformanceCharacteristics:
         When: Performing repeated analyses
         Then: Memory usage remains stable
         """
-        # Perform multiple analyses
-        for i in range(10):
-            code = code_factory.make_function(
-                name=f"memory_test_{i}",
-                lines=50,
-                complexity=3
-            )
-            
-            guidance = analyzer.analyze_file(f"memory_{i}.py", code)
+        # Perform multiple analyses in one batch
+        files = [
+            (f"memory_{i}.py", code_factory.make_function(name=f"memory_test_{i}", lines=50, complexity=3))
+            for i in range(10)
+        ]
+        
+        results = analyzer.analyze_files(files)
+        
+        assert len(results) == len(files)
+        for i, guidance in enumerate(results):
             assert isinstance(guidance, list), f"Analysis {i} should succeed"
         
         # If we reach here without memory errors, test passes
@@ -442,159 +580,26 @@ class TestPerformanceCharacteristics:
 class TestRealWorldScenarios:
     """Test with realistic code scenarios."""
 
-    def test_django_model_like_code(self, analyzer, guidance_validator):
-        """Test analysis of Django model-like code."""
-        django_like_code = '''
-from django.db import models
-from django.contrib.auth.models import User
-
-class BlogPost(models.Model):
-    title = models.CharField(max_length=200)
-    content = models.TextField()
-    author = models.ForeignKey(User, on_delete=models.CASCADE)
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
-    is_published = models.BooleanField(default=False)
-    
-    class Meta:
-        ordering = ['-created_at']
-        
-    def __str__(self):
-        return self.title
-    
-    def get_absolute_url(self):
-        from django.urls import reverse
-        return reverse('blog:detail', kwargs={'pk': self.pk})
-    
-    def publish(self):
-        self.is_published = True
-        self.save()
+    @pytest.mark.parametrize("sample_name", [
+        "simple_functions",
+        "complex_function",
+        "class_example",
+        "problematic_code",
+    ])
+    def test_sample_code_file_analysis(self, analyzer, sample_code_files, sample_name, guidance_validator):
+        """Test analysis of the sample code files shipped with the test fixtures."""
+        guidance = analyzer.analyze_file(f"{sample_name}.py", sample_code_files[sample_name])
         
-    def unpublish(self):
-        self.is_published = False
-        self.save()
-'''
-        
-        guidance = analyzer.analyze_file("models.py", django_like_code)
         guidance_validator(guidance)
-
-    def test_flask_route_like_code(self, analyzer, guidance_validator):
-        """Test analysis of Flask route-like code."""
-        flask_like_code = '''
-from flask import Flask, request, jsonify, render_template
-import sqlite3
-
-app = Flask(__name__)
-
-@app.route('/')
-def home():
-    return render_template('index.html')
-
-@app.route('/api/users', methods=['GET', 'POST'])
-def handle_users():
-    if request.method == 'GET':
-        conn = sqlite3.connect('database.db')
-        cursor = conn.cursor()
-        cursor.execute('SELECT * FROM users')
-        users = cursor.fetchall()
-        conn.close()
-        return jsonify(users)
-    
-    elif request.method == 'POST':
-        data = request.get_json()
-        if not data or 'name' not in data or 'email' not in data:
-            return jsonify({'error': 'Invalid data'}), 400
-        
-        conn = sqlite3.connect('database.db')
-        cursor = conn.cursor()
-        cursor.execute(
-            'INSERT INTO users (name, email) VALUES (?, ?)',
-            (data['name'], data['email'])
-        )
-        conn.commit()
-        user_id = cursor.lastrowid
-        conn.close()
-        
-        return jsonify({'id': user_id, 'name': data['name'], 'email': data['email']}), 201
-
-if __name__ == '__main__':
-    app.run(debug=True)
-'''
-        
-        guidance = analyzer.analyze_file("app.py", flask_like_code)
+        if sample_name == "problematic_code":
+            assert any(g.issue_type == "syntax_error" for g in guidance), "Should report the syntax error"
+
+    @pytest.mark.parametrize("filename, code", [
+        ("models.py", _DJANGO_MODEL_CODE),
+        ("app.py", _FLASK_ROUTE_CODE),
+        ("data_processor.py", _DATA_PROCESSING_CODE),
+    ], ids=["django_model", "flask_route", "data_processing"])
+    def test_framework_like_code(self, analyzer, filename, code, guidance_validator):
+        """Test analysis of Django model, Flask route and data processing code."""
+        guidance = analyzer.analyze_file(filename, code)
         guidance_validator(guidance)
-
-    def test_data_processing_script(self, analyzer, guidance_validator):
-        """Test analysis of data processing script."""
-        data_script = '''
-import pandas as pd
-import numpy as np
-from datetime import datetime, timedelta
-
-def load_and_process_data(file_path, start_date=None, end_date=None):
-    """Load and process CSV data file."""
-    # Load data
-    try:
-        df = pd.read_csv(file_path)
-    except FileNotFoundError:
-        print(f"File {file_path} not found")
-        return None
-    
-    # Data cleaning
-    df = df.dropna()
-    df = df.drop_duplicates()
-    
-    # Date filtering
-    if 'date' in df.columns:
-        df['date'] = pd.to_datetime(df['date'])
-        if start_date:
-            df = df[df['date'] >= start_date]
-        if end_date:
-            df = df[df['date'] <= end_date]
-    
-    # Calculate metrics
-    if 'value' in df.columns:
-        df['value_normalized'] = (df['value'] - df['value'].mean()) / df['value'].std()
-        df['value_percentile'] = df['value'].rank(pct=True)
-    
-    # Group and aggregate
-    if 'category' in df.columns:
-        grouped = df.groupby('category').agg({
-            'value': ['sum', 'mean', 'count'],
-            'date': ['min', 'max']
-        }).reset_index()
-        return df, grouped
-    
-    return df
-
-def generate_report(processed_data):
-    """Generate summary report from processed data."""
-    if processed_data is None:
-        return "No data to process"
-    
-    if isinstance(processed_data, tuple):
-        df, grouped = processed_data
-        report = f"""
-Data Summary Report
-==================
-Total records: {len(df)}
-Date range: {df['date'].min()} to {df['date'].max()}
-Categories: {df['category'].nunique()}
-
-Category Summary:
-{grouped.to_string(index=False)}
-        """
-    else:
-        df = processed_data
-        report = f"""
-Data Summary Report
-==================
-Total records: {len(df)}
-Columns: {', '.join(df.columns)}
-        """
-    
-    return report
-'''
-        
-        guidance = analyzer.analyze_file("data_processor.py", data_script)
-        guidance_validator(guidance)
\ No newline at end of file
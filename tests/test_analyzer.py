@@ -8,10 +8,6 @@ import tempfile
 import os
 from unittest.mock import patch, MagicMock
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
 from mcp_refactoring_assistant.models import RefactoringGuidance, ExtractableBlock
 
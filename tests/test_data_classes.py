@@ -6,10 +6,6 @@ Tests for core data classes: ExtractableBlock and RefactoringGuidance
 import pytest
 from typing import Dict, Any
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
-
 from mcp_refactoring_assistant.models import ExtractableBlock, RefactoringGuidance
 
 
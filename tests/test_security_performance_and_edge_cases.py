@@ -187,9 +187,9 @@ def legacy_function_{i}(data_list, config_file):
         """Test performance with large files containing many security issues"""
         large_code = self.generate_large_vulnerable_code(size_factor=5)  # 5x repetition
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         guidance = self.security_analyzer.analyze(large_code, "large_vulnerable.py")
-        analysis_time = time.time() - start_time
+        analysis_time = time.perf_counter() - start_time
         
         # Should complete within reasonable time (adjust threshold as needed)
         assert analysis_time < 60, f"Security analysis took too long: {analysis_time}s"
@@ -204,9 +204,9 @@ def legacy_function_{i}(data_list, config_file):
         """Test performance with large files containing many modernization opportunities"""
         large_code = self.generate_large_legacy_code(size_factor=5)  # 5x repetition
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         guidance = self.patterns_analyzer.analyze(large_code, "large_legacy.py")
-        analysis_time = time.time() - start_time
+        analysis_time = time.perf_counter() - start_time
         
         # Should complete within reasonable time
         assert analysis_time < 60, f"Patterns analysis took too long: {analysis_time}s"
@@ -222,9 +222,9 @@ def legacy_function_{i}(data_list, config_file):
         large_legacy = self.generate_large_legacy_code(size_factor=3)
         combined_large_code = large_vulnerable + "\n\n" + large_legacy
         
-        start_time = time.time()
+        start_time = time.perf_counter()
         guidance = self.unified_analyzer.analyze(combined_large_code, "large_combined.py")
-        analysis_time = time.time() - start_time
+        analysis_time = time.perf_counter() - start_time
         
         # Should complete within reasonable time (unified analysis may take longer)
         assert analysis_time < 120, f"Unified analysis took too long: {analysis_time}s"
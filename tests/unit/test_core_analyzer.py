@@ -6,13 +6,10 @@ Focus on analyzer orchestration, error handling, and specific behavior.
 """
 
 import pytest
-import os
 from unittest.mock import patch, Mock
 
-import sys
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
-
 from mcp_refactoring_assistant.core import EnhancedRefactoringAnalyzer
+from mcp_refactoring_assistant.core.analyzer import _parse
 from mcp_refactoring_assistant.models.data_classes import RefactoringGuidance
 
 
@@ -20,13 +17,13 @@ from mcp_refactoring_assistant.models.data_classes import RefactoringGuidance
 class TestAnalyzerOrchestration:
     """Test analyzer orchestration and coordination logic."""
 
-    def test_analyzer_graceful_initialization_failure(self, temp_dir):
+    def test_analyzer_graceful_initialization_failure(self, empty_project_dir):
         """Test analyzer handles initialization gracefully."""
         # Should not crash during initialization
-        analyzer = EnhancedRefactoringAnalyzer(project_path=str(temp_dir))
+        analyzer = EnhancedRefactoringAnalyzer(project_path=str(empty_project_dir))
         
         # Should still have basic attributes set
-        assert analyzer.project_path == str(temp_dir)
+        assert analyzer.project_path == str(empty_project_dir)
         assert hasattr(analyzer, 'analyzers')
         
         # Should handle analysis gracefully even with potential analyzer issues
@@ -150,12 +147,12 @@ def broken_function(
 class TestAnalyzerConfiguration:
     """Test analyzer configuration and customization."""
 
-    def test_analyzer_respects_project_path_context(self, temp_dir):
+    def test_analyzer_respects_project_path_context(self, empty_project_dir):
         """Test that analyzer uses project path for context."""
         # Create analyzer with specific project path
-        analyzer = EnhancedRefactoringAnalyzer(project_path=str(temp_dir))
+        analyzer = EnhancedRefactoringAnalyzer(project_path=str(empty_project_dir))
         
-        assert analyzer.project_path == str(temp_dir)
+        assert analyzer.project_path == str(empty_project_dir)
         
         # Analysis should work with the configured path
         result = analyzer.analyze_file("context_test.py", "def test(): pass")
@@ -196,6 +193,54 @@ class TestAnalyzerConfiguration:
             assert isinstance(result, list), f"Worker {worker_id} result invalid"
 
 
+@pytest.mark.unit
+class TestAnalyzerBatchAnalysis:
+    """Test analyzing several files in one call."""
+
+    def test_analyze_files_matches_analyze_file(self, analyzer, simple_function_code, complex_function_code):
+        """Test that batch results match per-file analysis, in order."""
+        files = [
+            ("simple.py", simple_function_code),
+            ("complex.py", complex_function_code),
+            ("simple_copy.py", simple_function_code),
+        ]
+        
+        results = analyzer.analyze_files(files)
+        
+        assert len(results) == len(files)
+        for (file_path, content), result in zip(files, results):
+            expected = analyzer.analyze_file(file_path, content)
+            assert [(g.issue_type, g.location) for g in result] == \
+                [(g.issue_type, g.location) for g in expected]
+
+    def test_analyze_files_reports_syntax_errors_per_file(self, analyzer, syntax_error_code, simple_function_code):
+        """Test that one unparsable file does not stop the rest of the batch."""
+        results = analyzer.analyze_files([
+            ("broken.py", syntax_error_code),
+            ("simple.py", simple_function_code),
+        ])
+        
+        assert [g.issue_type for g in results[0]] == ["syntax_error"]
+        assert results[0][0].severity == "critical"
+        assert all(g.issue_type != "syntax_error" for g in results[1])
+
+    def test_analyze_files_empty_batch(self, analyzer):
+        """Test that an empty batch returns no results."""
+        assert analyzer.analyze_files([]) == []
+
+    def test_repeated_source_is_parsed_once(self, analyzer, simple_function_code):
+        """Test that analyzing the same source again reuses the cached parse."""
+        _parse.cache_clear()
+        
+        analyzer.analyze_files([
+            ("first.py", simple_function_code),
+            ("second.py", simple_function_code),
+        ])
+        
+        info = _parse.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+
 @pytest.mark.unit
 class TestAnalyzerBusinessLogic:
     """Test specific business logic in the analyzer."""
@@ -252,6 +297,18 @@ def function_at_line_2():  # Line 2
                         # Line number extraction failed, but location exists
                         pass
 
+    def test_large_file_with_many_classes_reports_split_steps(self, analyzer, code_factory):
+        """Test a large file with many classes gets one string step per suggestion."""
+        classes = [code_factory.make_class(f"Class{i}", methods=8) for i in range(5)]
+        code = "\n\n\n".join(classes) + "\n" * 500
+
+        guidance_list = analyzer.analyze_file("large_test.py", code)
+
+        large_file = [g for g in guidance_list if g.issue_type == "large_file"]
+        assert len(large_file) == 1
+        assert all(isinstance(step, str) for step in large_file[0].precise_steps)
+        assert any("Extract class 'Class0'" in step for step in large_file[0].precise_steps)
+
 
 @pytest.mark.unit
 @pytest.mark.slow
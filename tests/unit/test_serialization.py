@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the JSON serializer shared by the CLI and MCP servers.
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_refactoring_assistant import serialization
+from mcp_refactoring_assistant.serialization import dumps_json
+
+# Shaped like a tool response: nested lists and dicts, non-ASCII text
+_PAYLOAD = {
+    "file_path": "src/módulo.py",
+    "total_issues": 2,
+    "ratio": 0.25,
+    "issues_by_severity": {"high": 1, "low": 1, "critical": 0},
+    "guidance": [
+        {"issue_type": "long_function", "location": "Line 3", "steps": ["Extract — helper"]},
+        {"issue_type": "dead_code", "location": "Line 9", "steps": []},
+    ],
+    "has_errors": False,
+    "note": None,
+}
+
+
+@pytest.fixture(params=[
+    "json",
+    pytest.param("orjson", marks=pytest.mark.skipif(
+        not serialization.ORJSON_AVAILABLE, reason="orjson not installed"
+    )),
+])
+def backend(request, monkeypatch):
+    """Run the test against each available serializer backend."""
+    monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", request.param == "orjson")
+    return request.param
+
+
+@pytest.mark.unit
+class TestDumpsJson:
+    """Test dumps_json matches the json.dumps(indent=2) output it replaced."""
+
+    def test_matches_previous_json_dumps_output(self, backend):
+        """Test the output parses back to the same value as json.dumps(indent=2)."""
+        previous = json.dumps(_PAYLOAD, indent=2)
+
+        assert json.loads(dumps_json(_PAYLOAD)) == json.loads(previous)
+
+    def test_stdlib_backend_is_byte_identical(self, monkeypatch):
+        """Test the stdlib fallback writes exactly what json.dumps(indent=2) wrote."""
+        monkeypatch.setattr(serialization, "ORJSON_AVAILABLE", False)
+
+        assert dumps_json(_PAYLOAD) == json.dumps(_PAYLOAD, indent=2)
+
+    def test_unserializable_value_raises(self, backend):
+        """Test values json.dumps rejects are rejected rather than stringified."""
+        with pytest.raises(TypeError):
+            dumps_json({"path": Path("module.py")})
+
+    def test_default_renders_unserializable_value(self, backend):
+        """Test an explicit default is used for values that are not serializable."""
+        assert json.loads(dumps_json({"path": Path("module.py")}, default=str)) == {"path": "module.py"}
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the package analysis source file cache.
+"""
+
+import os
+
+import pytest
+
+from mcp_refactoring_assistant.analyzers.package.source_cache import read_source_file
+
+
+@pytest.mark.unit
+class TestSourceCache:
+    """Test that cached source reads stay consistent with the file system."""
+
+    def test_repeated_reads_return_file_contents(self, temp_dir):
+        """Test repeated reads of an unchanged file share one cache entry."""
+        source = temp_dir / "module.py"
+        source.write_text("def f():\n    return 1\n")
+        cache = {}
+
+        assert read_source_file(source, cache) == "def f():\n    return 1\n"
+        assert read_source_file(str(source), cache) == "def f():\n    return 1\n"
+        assert len(cache) == 1
+
+    def test_reads_without_cache(self, temp_dir):
+        """Test a read without a cache returns the file contents."""
+        source = temp_dir / "module.py"
+        source.write_text("x = 1\n")
+
+        assert read_source_file(source) == "x = 1\n"
+
+    def test_modified_file_is_reread(self, temp_dir):
+        """Test a file is read again once its modification time changes."""
+        source = temp_dir / "module.py"
+        source.write_text("x = 1\n")
+        cache = {}
+        assert read_source_file(source, cache) == "x = 1\n"
+
+        source.write_text("x = 2\n")
+        stat = source.stat()
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert read_source_file(source, cache) == "x = 2\n"
+
+    def test_resized_file_with_same_mtime_is_reread(self, temp_dir):
+        """Test a file is read again when only its size changes."""
+        source = temp_dir / "module.py"
+        source.write_text("x = 1\n")
+        stat = source.stat()
+        cache = {}
+        assert read_source_file(source, cache) == "x = 1\n"
+
+        source.write_text("x = 10\n")
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert read_source_file(source, cache) == "x = 10\n"
+
+    def test_missing_file_raises(self, temp_dir):
+        """Test a missing file raises like a plain open() would."""
+        with pytest.raises(OSError):
+            read_source_file(temp_dir / "missing.py", {})